@@ -5,8 +5,9 @@ applications. It includes command handling, event processing, repository
 management, projection/query handling, and application lifecycle management.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .application import Application, ApplicationBuilder, HasLifecycle
-from .configurators import ApplicationProfile
 from .middleware import (
     ConcurrencyRetryMiddleware,
     ContextPropagationMiddleware,
@@ -28,6 +29,20 @@ from .projections import (
     QueryToProjectionMap,
 )
 
+if TYPE_CHECKING:
+    from .configurators import ApplicationProfile
+
+
+def __getattr__(name: str) -> Any:
+    # Profiles pull in pydantic-settings, which is only needed for
+    # convention-based configuration, so they are imported on first use.
+    if name == "ApplicationProfile":
+        from .configurators import ApplicationProfile
+
+        return ApplicationProfile
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Application
     "Application",
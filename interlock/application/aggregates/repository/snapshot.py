@@ -41,6 +41,22 @@ class AggregateSnapshotStorageBackend(ABC):
         """
         ...
 
+    async def save_snapshots(self, aggregates: list["Aggregate"]) -> None:
+        """Save snapshots of several aggregates.
+
+        Each aggregate is saved as by `save_snapshot`, in order. Backends that
+        can write all snapshots in a single round trip should override this;
+        the default saves each one in turn.
+
+        Args:
+            aggregates (list[Aggregate]): The aggregates to save.
+
+        Returns:
+            None
+        """
+        for aggregate in aggregates:
+            await self.save_snapshot(aggregate)
+
     @abstractmethod
     async def load_snapshot(
         self,
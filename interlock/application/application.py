@@ -1,5 +1,8 @@
 import asyncio
-from collections.abc import Callable
+import sys
+import warnings
+from collections.abc import Callable, Coroutine
+from datetime import timedelta
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
 from uuid import UUID
@@ -36,6 +39,7 @@ from .events import (
     EventProcessor,
     EventProcessorExecutor,
     EventStore,
+    EventSubscription,
     EventTransport,
     EventUpcaster,
     InMemoryEventStore,
@@ -73,26 +77,63 @@ class HasLifecycle(Protocol):
 
 
 class Application:
-    def __init__(self, contextual_binding: ContextualBinding):
+    def __init__(
+        self,
+        contextual_binding: ContextualBinding,
+        warm_up: bool = False,
+        use_uvloop: bool = False,
+    ):
         self.contextual_binding = contextual_binding
-        self.command_bus = self.resolve(CommandBus)
-        self.event_bus = self.resolve(EventBus)
-        self.query_bus = self.resolve(QueryBus)
-
-    async def dispatch(self, command: Command[T]) -> T:
+        self.warm_up_enabled = warm_up
+        self.uvloop_enabled = use_uvloop
+
+        # The buses are only ever registered on the root container, so we
+        # resolve them there directly. Going through the contextual binding
+        # would allocate a child container per bus type that every later
+        # all_of_type() scan then has to walk past.
+        root = contextual_binding.container
+        self.command_bus = root.resolve(CommandBus)
+        self.event_bus = root.resolve(EventBus)
+        self.query_bus = root.resolve(QueryBus)
+
+    def dispatch(self, command: Command[T]) -> Coroutine[Any, Any, T]:
         """Dispatch a command to the application.
 
         This method will dispatch a command to the application. The command
         will be dispatched to the command bus and the command bus will dispatch
         the command to the appropriate aggregate and middleware chain.
 
+        The command bus coroutine is returned as-is rather than awaited here,
+        so awaiting the result does not go through an extra coroutine frame.
+
         Args:
             command: The command to dispatch.
 
         Returns:
-            The result from the command handler.
+            An awaitable of the result from the command handler.
+        """
+        return self.command_bus.dispatch(command)
+
+    def run(self, main: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on a new event loop until it completes.
+
+        This is the application's counterpart to `asyncio.run`. If uvloop
+        was enabled on the builder, the coroutine is run on a uvloop event
+        loop; otherwise on the default one. The global event loop policy is
+        left untouched either way.
+
+        Args:
+            main: The coroutine to run, e.g. `app.run_event_processors(...)`.
+
+        Returns:
+            The result of the coroutine.
         """
-        return await self.command_bus.dispatch(command)
+        if self.uvloop_enabled:
+            import uvloop
+
+            result: T = uvloop.run(main)
+            return result
+        return asyncio.run(main)
 
     async def query(self, query: Query[T]) -> T:
         """Execute a query against the application.
@@ -128,14 +169,33 @@ class Application:
         """
         return self.contextual_binding.resolve(type_to_resolve)
 
+    def warm_up(self) -> None:
+        """Prepare the application so the first request is not slower.
+
+        Dependencies are otherwise built lazily, so the first command to
+        reach a singleton pays for constructing it (and everything it
+        depends on) and the first dispatch of each command type pays for
+        building its middleware chain. This builds all singletons registered
+        on the root container, introspects its factories, and builds the
+        command bus chain for every routed command type up front.
+
+        Raises:
+            DependencyNotFoundError: If a root singleton cannot be resolved.
+        """
+        self.contextual_binding.container.warm_up()
+        self.command_bus.warm_up()
+
     async def startup(self) -> None:
         """Startup the application.
 
         This method will startup the application. The application will be
         started by calling the on_startup method on all dependencies that
         implement the `HasLifecycle` protocol. The dependencies are started
-        in the order of their registration.
+        in the order of their registration. If warm up was enabled on the
+        builder, the application is warmed up first (see `warm_up`).
         """
+        if self.warm_up_enabled:
+            self.warm_up()
         dependencies = self.contextual_binding.resolve_all_of_type(HasLifecycle)  # type: ignore[type-abstract]
         for dependency in dependencies:
             await dependency.on_startup()
@@ -183,28 +243,53 @@ class Application:
         Returns:
             None
         """
-        # We will resolve each processors executor from its own container
-        # context and then subscribe to the event transport for the processor.
-        executors = [
-            self.contextual_binding.container_for(processor).resolve(EventProcessorExecutor)
-            for processor in processors
-        ]
+        # Nothing to run, so don't bother resolving the transport or
+        # building the executor and subscription lists.
+        if not processors:
+            return
 
+        # We will resolve each processors executor from its own container
+        # context and then subscribe to the event transport for the processor,
+        # collecting both in a single pass. Processors ignore events they have
+        # no handler for, so we let the transport filter those out up front
+        # where it can. A processor without any registered handlers gets the
+        # full stream.
         transport = self.contextual_binding.resolve(EventTransport)  # type: ignore[type-abstract]
-        subscriptions = [
-            await transport.subscribe(executor.processor.__class__.__name__)
-            for executor in executors
-        ]
+        container_for = self.contextual_binding.container_for
+        subscribe = transport.subscribe
+        subscribe_to_types = transport.subscribe_to_types
+        subscribed: list[tuple[EventProcessorExecutor[Any], EventSubscription]] = []
+        for processor in processors:
+            executor = container_for(processor).resolve(EventProcessorExecutor)
+            processor_type = type(executor.processor)
+            event_types = processor_type.handled_event_types()
+            if event_types:
+                subscription = await subscribe_to_types(processor_type.__name__, event_types)
+            else:
+                subscription = await subscribe(processor_type.__name__)
+            subscribed.append((executor, subscription))
 
         # Now that we have a subscription for each processor, we can run the
-        # processors in their own async tasks. We will gather the tasks and
-        # await them all to complete (This will probably be 'forever' since
-        # the processors are expected to run until the application is stopped).
-        tasks = [
-            executor.run(subscription)
-            for executor, subscription in zip(executors, subscriptions, strict=False)
-        ]
-        await asyncio.gather(*tasks)
+        # processors in their own async tasks and await them all to complete
+        # (This will probably be 'forever' since the processors are expected
+        # to run until the application is stopped). The run coroutines are
+        # only created once every subscription succeeded so none is left
+        # un-awaited if subscribing fails.
+        runs = [executor.run(subscription) for executor, subscription in subscribed]
+        if sys.version_info >= (3, 11):
+            # A task group cancels the remaining processors as soon as one of
+            # them fails rather than leaving them running detached like
+            # gather() does. We unwrap the group so callers still see the
+            # processor's own exception, chained to the group so no other
+            # failure is lost.
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for run in runs:
+                        task_group.create_task(run)
+            except ExceptionGroup as group:  # noqa: F821 - Python 3.11+ only
+                raise group.exceptions[0] from group
+        else:
+            await asyncio.gather(*runs)
 
     def aggregate_scenario(
         self,
@@ -350,92 +435,55 @@ class Application:
 class ApplicationBuilder:
     """Builder for creating Application instances."""
 
+    __slots__ = (
+        "_middleware",
+        "container",
+        "contextual_binding",
+        "uvloop_enabled",
+        "warm_up_enabled",
+    )
+
     def __init__(self) -> None:
         self.container = DependencyContainer()
         self.contextual_binding = ContextualBinding(self.container)
-
-        # Event Bus Defaults:
-        self.container.register_singleton(
-            dependency_type=UpcastingStrategy,  # type: ignore[type-abstract]
-            factory=LazyUpcastingStrategy,
-        )
-        self.container.register_singleton(
-            dependency_type=EventTransport,  # type: ignore[type-abstract]
-            factory=InMemoryEventTransport,
-        )
-        self.container.register_singleton(
-            dependency_type=EventStore,  # type: ignore[type-abstract]
-            factory=InMemoryEventStore,
-        )
-        self.container.register_singleton(
-            dependency_type=UpcasterMap,
-            factory=self._build_upcaster_map,
-        )
-        self.container.register_singleton(UpcastingPipeline)
-        self.container.register_singleton(
-            dependency_type=EventDelivery,  # type: ignore[type-abstract]
-            factory=self._build_synchronous_delivery,
-        )
-        self.container.register_singleton(EventBus)
-
-        # Aggregate Repository Defaults:
-        self.container.register_singleton(
-            dependency_type=AggregateSnapshotStrategy,  # type: ignore[type-abstract]
-            factory=AggregateSnapshotStrategy.never,
-        )
-        self.container.register_singleton(
-            dependency_type=AggregateCacheBackend,  # type: ignore[type-abstract]
-            factory=AggregateCacheBackend.null,
-        )
-        self.container.register_singleton(
-            dependency_type=AggregateSnapshotStorageBackend,  # type: ignore[type-abstract]
-            factory=AggregateSnapshotStorageBackend.null,
-        )
-
-        # Event Processor Defaults:
-        self.container.register_singleton(
-            dependency_type=CatchupCondition,  # type: ignore[type-abstract]
-            factory=Never,
-        )
-        self.container.register_singleton(
-            dependency_type=CatchupStrategy,  # type: ignore[type-abstract]
-            factory=NoCatchup,
-        )
-        self.container.register_singleton(
-            dependency_type=CacheStrategy,  # type: ignore[type-abstract]
-            factory=CacheStrategy.never,
-        )
-
-        # Command Bus Defaults:
-        self.container.register_singleton(
-            dependency_type=CommandToAggregateMap,
-            factory=self._build_command_to_aggregate_map,
-        )
-        self.container.register_singleton(
-            dependency_type=AggregateToRepositoryMap,
-            factory=self._build_aggregate_to_repository_map,
-        )
-        self.container.register_singleton(DelegateToAggregate)
-        self.container.register_singleton(
-            dependency_type=CommandBus,
-            factory=self._build_command_bus,
-        )
-
-        self.container.register_singleton(SagaStateStore, SagaStateStore.in_memory)  # type: ignore[type-abstract]
-
-        # Query Bus Defaults:
-        self.container.register_singleton(
-            dependency_type=QueryToProjectionMap,
-            factory=self._build_query_to_projection_map,
-        )
-        self.container.register_singleton(
-            dependency_type=ProjectionRegistry,
-            factory=self._build_projection_registry,
-        )
-        self.container.register_singleton(DelegateToProjection)
-        self.container.register_singleton(
-            dependency_type=QueryBus,
-            factory=self._build_query_bus,
+        self.uvloop_enabled = False
+        self.warm_up_enabled = False
+        # Resolved middleware shared by the command and query buses. Cleared
+        # whenever a registration could change it.
+        self._middleware: list[Middleware] | None = None
+
+        # All defaults are registered in one go. The order of the entries is
+        # the registration order, which lifecycle hooks are run in.
+        self.container.register_singletons(
+            {
+                # Event Bus Defaults:
+                UpcastingStrategy: LazyUpcastingStrategy,
+                EventTransport: InMemoryEventTransport,
+                EventStore: InMemoryEventStore,
+                UpcasterMap: self._build_upcaster_map,
+                UpcastingPipeline: UpcastingPipeline,
+                EventDelivery: self._build_synchronous_delivery,
+                EventBus: EventBus,
+                # Aggregate Repository Defaults:
+                AggregateSnapshotStrategy: AggregateSnapshotStrategy.never,
+                AggregateCacheBackend: AggregateCacheBackend.null,
+                AggregateSnapshotStorageBackend: AggregateSnapshotStorageBackend.null,
+                # Event Processor Defaults:
+                CatchupCondition: Never,
+                CatchupStrategy: NoCatchup,
+                CacheStrategy: CacheStrategy.never,
+                # Command Bus Defaults:
+                CommandToAggregateMap: self._build_command_to_aggregate_map,
+                AggregateToRepositoryMap: self._build_aggregate_to_repository_map,
+                DelegateToAggregate: DelegateToAggregate,
+                CommandBus: self._build_command_bus,
+                SagaStateStore: SagaStateStore.in_memory,
+                # Query Bus Defaults:
+                QueryToProjectionMap: self._build_query_to_projection_map,
+                ProjectionRegistry: self._build_projection_registry,
+                DelegateToProjection: DelegateToProjection,
+                QueryBus: self._build_query_bus,
+            }
         )
 
     def register_dependency(
@@ -461,6 +509,7 @@ class ApplicationBuilder:
             The application builder
         """
         self.container.register_singleton(dependency_type, factory or dependency_type)
+        self._middleware = None
         return self
 
     def register_aggregate(
@@ -540,6 +589,7 @@ class ApplicationBuilder:
         container = self.contextual_binding.container_for(middleware_type)
         container.register_singleton(middleware_type)
         container.register_singleton(Middleware, middleware_type)
+        self._middleware = None
         return self
 
     def register_event_processor(
@@ -547,6 +597,7 @@ class ApplicationBuilder:
         processor_type: type[EventProcessor],
         catchup_condition: CatchupCondition | None = None,
         catchup_strategy: "CatchupStrategy[Any] | None" = None,
+        max_batch_delay: timedelta | None = None,
     ) -> "ApplicationBuilder":
         """Creates or updates the registration of an event processor.
 
@@ -560,13 +611,18 @@ class ApplicationBuilder:
             processor_type: The type of the event processor to register
             catchup_condition: The condition to trigger catchup
             catchup_strategy: The strategy to use for catchup
+            max_batch_delay: The longest time the processor's executor waits
+                for a batch to fill up before checking lag (Optional)
 
         Returns:
             The application builder
         """
         container = self.contextual_binding.container_for(processor_type)
         container.register_singleton(processor_type)
-        container.register_singleton(EventProcessorExecutor)
+        container.register_singleton(
+            EventProcessorExecutor,
+            self._executor_factory(processor_type, max_batch_delay),
+        )
         if catchup_condition:
             container.register_singleton(CatchupCondition, lambda: catchup_condition)  # type: ignore[type-abstract]
         if catchup_strategy:
@@ -578,6 +634,7 @@ class ApplicationBuilder:
         projection_type: type[Projection],
         catchup_condition: CatchupCondition | None = None,
         catchup_strategy: "CatchupStrategy[Any] | None" = None,
+        max_batch_delay: timedelta | None = None,
     ) -> "ApplicationBuilder":
         """Register a projection with the application.
 
@@ -593,6 +650,8 @@ class ApplicationBuilder:
             projection_type: The projection class to register.
             catchup_condition: The condition to trigger catchup.
             catchup_strategy: The strategy to use for catchup.
+            max_batch_delay: The longest time the projection's executor waits
+                for a batch to fill up before checking lag (Optional).
 
         Returns:
             The application builder.
@@ -602,7 +661,10 @@ class ApplicationBuilder:
         container.register_singleton(projection_type)
         container.register_singleton(Projection, projection_type)
         container.register_singleton(EventProcessor, projection_type)
-        container.register_singleton(EventProcessorExecutor)
+        container.register_singleton(
+            EventProcessorExecutor,
+            self._executor_factory(projection_type, max_batch_delay),
+        )
         if catchup_condition:
             container.register_singleton(CatchupCondition, lambda: catchup_condition)  # type: ignore[type-abstract]
         if catchup_strategy:
@@ -659,6 +721,42 @@ class ApplicationBuilder:
             profile.configure(self)
         return self
 
+    def use_uvloop(self, enable: bool = True) -> "ApplicationBuilder":
+        """Run the application on uvloop's event loop when it is installed.
+
+        uvloop is a drop-in replacement for the default asyncio event loop
+        that considerably speeds up I/O bound workloads such as event
+        processors pulling from a transport. When enabled,
+        `Application.run()` runs its coroutine on a uvloop event loop. If
+        uvloop is not installed (see the `uvloop` extra), `build()` warns
+        and the default event loop is used.
+
+        Args:
+            enable: Whether to run the application on uvloop.
+
+        Returns:
+            The application builder
+        """
+        self.uvloop_enabled = enable
+        return self
+
+    def warm_up_on_startup(self, enable: bool = True) -> "ApplicationBuilder":
+        """Warm up the application when it is started.
+
+        When enabled, `Application.startup()` calls `Application.warm_up()`
+        before running lifecycle hooks, so singletons and command bus chains
+        are built before the first request instead of during it. This also
+        surfaces unresolvable root dependencies at startup.
+
+        Args:
+            enable: Whether to warm up the application on startup.
+
+        Returns:
+            The application builder
+        """
+        self.warm_up_enabled = enable
+        return self
+
     def build(self) -> Application:
         """Build the application with dependency injection.
 
@@ -673,18 +771,60 @@ class ApplicationBuilder:
         Raises:
             ValueError: If dependencies cannot be resolved (missing, etc.)
         """
-        return Application(self.contextual_binding)
+        return Application(
+            self.contextual_binding,
+            warm_up=self.warm_up_enabled,
+            use_uvloop=self.uvloop_enabled and self._uvloop_installed(),
+        )
+
+    @staticmethod
+    def _uvloop_installed() -> bool:
+        try:
+            import uvloop  # noqa: F401
+        except ImportError:
+            warnings.warn(
+                "use_uvloop() is enabled but uvloop is not installed (see the `uvloop` "
+                "extra); the application will run on the default event loop.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+            return False
+        return True
+
+    def _executor_factory(
+        self,
+        processor_type: type[EventProcessor],
+        max_batch_delay: timedelta | None,
+    ) -> Callable[..., EventProcessorExecutor[Any]]:
+        # The executor is generic over its processor, which the container
+        # cannot resolve from the annotation, so we resolve the processor
+        # from its own context and inject the rest.
+        container = self.contextual_binding.container_for(processor_type)
+
+        def build_executor(
+            condition: CatchupCondition,
+            strategy: CatchupStrategy[Any],
+        ) -> EventProcessorExecutor[Any]:
+            return EventProcessorExecutor(
+                container.resolve(processor_type),
+                condition,
+                strategy,
+                max_batch_delay=max_batch_delay,
+            )
+
+        return build_executor
 
     def _build_command_to_aggregate_map(self) -> CommandToAggregateMap:
         all_aggregates = self.contextual_binding.all_of_type(Aggregate)
         return CommandToAggregateMap.from_aggregates(all_aggregates)
 
     def _build_aggregate_to_repository_map(self) -> AggregateToRepositoryMap:
-        all_repositories = [
-            self.contextual_binding.container_for(aggregate).resolve(AggregateRepository)
-            for aggregate in self.contextual_binding.all_of_type(Aggregate)
-        ]
-        return AggregateToRepositoryMap.from_repositories(all_repositories)
+        repository_map = AggregateToRepositoryMap()
+        repository_map.add_all(
+            container.resolve(AggregateRepository)
+            for _, container in self.contextual_binding.all_of_type_with_containers(Aggregate)
+        )
+        return repository_map
 
     def _build_upcaster_map(self) -> UpcasterMap:
         all = self.contextual_binding.resolve_all_of_type(EventUpcaster)  # type: ignore[type-abstract]
@@ -697,8 +837,13 @@ class ApplicationBuilder:
 
     def _build_command_bus(self) -> CommandBus:
         root_handler = self.container.resolve(DelegateToAggregate)
-        all_middleware = self.contextual_binding.resolve_all_of_type(Middleware)
-        return CommandBus(root_handler, all_middleware)
+        return CommandBus(root_handler, self._all_middleware())
+
+    def _all_middleware(self) -> list[Middleware]:
+        # Both buses wrap the same middleware, so scan for and resolve it once.
+        if self._middleware is None:
+            self._middleware = self.contextual_binding.resolve_all_of_type(Middleware)
+        return self._middleware
 
     def _build_query_to_projection_map(self) -> QueryToProjectionMap:
         all_projections = self.contextual_binding.all_of_type(Projection)
@@ -706,12 +851,11 @@ class ApplicationBuilder:
 
     def _build_projection_registry(self) -> ProjectionRegistry:
         all_projections = [
-            self.contextual_binding.container_for(proj).resolve(proj)
-            for proj in self.contextual_binding.all_of_type(Projection)
+            container.resolve(proj)
+            for proj, container in self.contextual_binding.all_of_type_with_containers(Projection)
         ]
         return ProjectionRegistry.from_projections(all_projections)
 
     def _build_query_bus(self) -> QueryBus:
         root_handler = self.container.resolve(DelegateToProjection)
-        all_middleware = self.contextual_binding.resolve_all_of_type(Middleware)
-        return QueryBus(root_handler, all_middleware)
+        return QueryBus(root_handler, self._all_middleware())
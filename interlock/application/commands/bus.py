@@ -1,11 +1,11 @@
 """Command bus and routing infrastructure."""
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
 from typing import Any, TypeVar, cast
 
 from ...domain import Aggregate, Command
 from ..aggregates import AggregateRepository
-from ..middleware import Handler, Middleware
+from ..middleware import Handler, Middleware, MiddlewareChains
 
 T = TypeVar("T")
 
@@ -44,8 +44,7 @@ class AggregateToRepositoryMap:
         repositories: list[AggregateRepository[Any]],
     ) -> "AggregateToRepositoryMap":
         map = AggregateToRepositoryMap()
-        for repository in repositories:
-            map.add(repository)
+        map.add_all(repositories)
         return map
 
     def __init__(self) -> None:
@@ -54,6 +53,12 @@ class AggregateToRepositoryMap:
     def add(self, repository: AggregateRepository[Any]) -> None:
         self.aggregate_to_repository_map[repository.aggregate_type] = repository
 
+    def add_all(self, repositories: Iterable[AggregateRepository[Any]]) -> None:
+        # A single dict.update rather than one add() call per repository.
+        self.aggregate_to_repository_map.update(
+            (repository.aggregate_type, repository) for repository in repositories
+        )
+
     def get(self, aggregate_type: type[Aggregate]) -> AggregateRepository[Any]:
         return self.aggregate_to_repository_map[aggregate_type]
 
@@ -88,6 +93,8 @@ class CommandBus:
         middleware: List of middleware to apply (in order).
     """
 
+    __slots__ = ("_chains", "middleware", "root_handler")
+
     def __init__(
         self,
         root_handler: DelegateToAggregate,
@@ -95,17 +102,18 @@ class CommandBus:
     ):
         self.root_handler = root_handler
         self.middleware = middleware
-        # Build the middleware chain by reducing from right to left
-        # Use Handler type (BaseModel -> Coroutine) for middleware compatibility
-        chain: Handler = cast("Handler", self.root_handler.handle)
-        for mw in reversed(middleware):
-            prev_chain = chain
+        # Chains holding only the middleware that intercept a given command
+        # type, built on first dispatch of that type.
+        self._chains = MiddlewareChains(cast("Handler", root_handler.handle), middleware)
 
-            def make_chain(m: Middleware, n: Handler) -> Handler:
-                return lambda msg: m.intercept(msg, n)
+    def warm_up(self) -> None:
+        """Build the middleware chain for every routed command type.
 
-            chain = make_chain(mw, prev_chain)
-        self.chain = chain
+        Chains are otherwise built on the first dispatch of each command
+        type, so this moves that cost out of the first request.
+        """
+        command_types = self.root_handler.command_to_aggregate_map.command_to_aggregate_map
+        self._chains.warm_up(command_types)
 
     async def dispatch(self, command: Command[T]) -> T:
         """Dispatch command through the middleware chain to handler.
@@ -116,5 +124,5 @@ class CommandBus:
         Returns:
             The result from the command handler.
         """
-        result: T = await self.chain(command)
+        result: T = await self._chains[type(command)](command)
         return result
@@ -1,4 +1,5 @@
 import inspect
+import weakref
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -16,6 +17,10 @@ if TYPE_CHECKING:
 
 FRAMEWORK_BASES = (Aggregate, Command, CommandMiddleware, EventProcessor)
 
+# Memoized results of ServicesInPackage._is_framework_type, keyed by class.
+# Weak keys, so caching a class does not keep it (and its module) alive.
+_framework_type_cache: weakref.WeakKeyDictionary[type, bool] = weakref.WeakKeyDictionary()
+
 
 class ApplicationProfile(ABC):
     """Base class for application configuration profiles.
@@ -102,10 +107,16 @@ class ServicesInPackage(ApplicationProfile):
 
     @staticmethod
     def _is_framework_type(cls: type) -> bool:
+        cached = _framework_type_cache.get(cls)
+        if cached is not None:
+            return cached
+
         try:
-            return issubclass(cls, FRAMEWORK_BASES)
+            result = issubclass(cls, FRAMEWORK_BASES)
         except TypeError:
-            return False
+            result = False
+        _framework_type_cache[cls] = result
+        return result
 
 
 class UpcastersInPackage(ApplicationProfile):
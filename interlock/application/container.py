@@ -1,12 +1,15 @@
 import inspect
 from abc import ABC, abstractmethod
-from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from itertools import chain
+from types import FunctionType
 from typing import Any, Generic, Optional, TypeVar, cast, get_origin
 
 T = TypeVar("T")
 
+# Marks a type with no resolved singleton instance (None is a valid instance).
+_UNRESOLVED = object()
+
 
 class DependencyNotFoundError(Exception):
     @classmethod
@@ -32,16 +35,60 @@ class Dependency(ABC, Generic[T]):
 class FactoryDependency(Dependency[T]):
     def __init__(self, factory: Callable[..., T]):
         self.factory = factory
+        self._required: list[tuple[str, Any]] | None = None
 
     def resolve(self, container: "DependencyContainer") -> T:
         return self.factory(**self.get_dependencies(container))
 
     def get_dependencies(self, container: "DependencyContainer") -> dict[str, Any]:
-        return {
-            k: container.resolve(v.annotation)
-            for k, v in inspect.signature(self.factory).parameters.items()
-            if v.annotation is not inspect.Parameter.empty and v.default is inspect.Parameter.empty
-        }
+        return {name: container.resolve(annotation) for name, annotation in self.required()}
+
+    def required(self) -> list[tuple[str, Any]]:
+        # A factory's signature never changes, so we only introspect it once
+        # and keep just the (name, type) pairs that need to be injected
+        # rather than filtering the parameters on every resolution.
+        if self._required is None:
+            required = _required_init_parameters(self.factory)
+            if required is None:
+                required = [
+                    (name, parameter.annotation)
+                    for name, parameter in inspect.signature(self.factory).parameters.items()
+                    if parameter.annotation is not inspect.Parameter.empty
+                    and parameter.default is inspect.Parameter.empty
+                ]
+            self._required = required
+        return self._required
+
+
+def _required_init_parameters(factory: Callable[..., Any]) -> list[tuple[str, Any]] | None:
+    # Fast path for the common case of a plain class with a plain __init__:
+    # read the parameters straight off the code object instead of having
+    # inspect.signature() build Parameter objects. Returns None whenever the
+    # signature could come from anywhere else (a metaclass __call__, __new__,
+    # __signature__, a wrapped or builtin __init__, *args/**kwargs) so the
+    # caller falls back to inspect.signature().
+    if (
+        not isinstance(factory, type)
+        or type(factory).__call__ is not type.__call__
+        or factory.__new__ is not object.__new__  # type: ignore[comparison-overlap]
+        or getattr(factory, "__signature__", None) is not None
+    ):
+        return None
+    init = factory.__init__  # type: ignore[misc]
+    if not isinstance(init, FunctionType) or hasattr(init, "__wrapped__"):
+        return None
+    code = init.__code__
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+        return None
+
+    positional = code.co_varnames[1 : code.co_argcount]
+    keyword_only = code.co_varnames[code.co_argcount : code.co_argcount + code.co_kwonlyargcount]
+    defaulted = len(init.__defaults__ or ())
+    names = list(positional[: len(positional) - defaulted])
+    kwdefaults = init.__kwdefaults__ or {}
+    names.extend(name for name in keyword_only if name not in kwdefaults)
+    annotations = init.__annotations__
+    return [(name, annotations[name]) for name in names if name in annotations]
 
 
 class SingletonDependency(Dependency[T]):
@@ -62,29 +109,55 @@ class SingletonDependency(Dependency[T]):
 
 
 class DependencyContainer:
+    __slots__ = ("dependencies", "parent", "resolved")
+
     def __init__(self, parent: Optional["DependencyContainer"] = None):
         self.dependencies: dict[type, Dependency[Any]] = {}
+        # Instances of singletons registered in this container that have
+        # already been resolved. Once the graph behind a singleton has been
+        # built, resolving it again is a single dict hit.
+        self.resolved: dict[type, Any] = {}
         self.parent = parent
 
     def child(self) -> "DependencyContainer":
         return DependencyContainer(self)
 
     def all_resolving(self) -> list[type]:
-        return [
-            k for k in self.dependencies if getattr(self.dependencies[k], "_resolving", False)
-        ] + (self.parent.all_resolving() if self.parent else [])
+        # Walk each container once, reading the dependencies we are already
+        # iterating rather than looking every key up again.
+        resolving: list[type] = []
+        container: DependencyContainer | None = self
+        while container is not None:
+            resolving.extend(
+                k
+                for k, dependency in container.dependencies.items()
+                if getattr(dependency, "_resolving", False)
+            )
+            container = container.parent
+        return resolving
 
     def resolve(self, dependency_type: type[T]) -> T:
+        instance = self.resolved.get(dependency_type, _UNRESOLVED)
+        if instance is not _UNRESOLVED:
+            return cast("T", instance)
+
         # First check ourselves for the dependency and then fall back to the
-        # parent container if it exists.
-        if dependency_type in self.dependencies:
-            return cast("T", self.dependencies[dependency_type].resolve(self))
+        # parent container if it exists. A single get() keeps this to one
+        # hash probe per container on the (very hot) hit path.
+        dependency = self.dependencies.get(dependency_type)
+        if dependency is not None:
+            instance = dependency.resolve(self)
+            if isinstance(dependency, SingletonDependency):
+                self.resolved[dependency_type] = instance
+            return cast("T", instance)
 
         # If the dependency is a generic type (e.g., AggregateFactory[A]),
         # try to resolve using the origin type (e.g., AggregateFactory)
         origin = get_origin(dependency_type)
-        if origin is not None and origin in self.dependencies:
-            return cast("T", self.dependencies[origin].resolve(self))
+        if origin is not None:
+            dependency = self.dependencies.get(origin)
+            if dependency is not None:
+                return cast("T", dependency.resolve(self))
 
         if self.parent is not None:
             return self.parent.resolve(dependency_type)
@@ -94,12 +167,22 @@ class DependencyContainer:
         # resolve it.
         raise DependencyNotFoundError.from_type(dependency_type)
 
+    def warm_up(self) -> None:
+        # Build every singleton registered here and introspect every factory
+        # up front, so neither cost is paid on first use.
+        for dependency_type, dependency in list(self.dependencies.items()):
+            if isinstance(dependency, SingletonDependency):
+                self.resolve(dependency_type)
+            elif isinstance(dependency, FactoryDependency):
+                dependency.required()
+
     def register(
         self,
         dependency_type: type[T],
         dependency: Dependency[T],
     ) -> None:
         self.dependencies[dependency_type] = dependency
+        self.resolved.pop(dependency_type, None)
 
     def register_factory(
         self,
@@ -114,11 +197,20 @@ class DependencyContainer:
         factory_dependency = FactoryDependency(factory or dependency_type)
         self.register(dependency_type, SingletonDependency(factory_dependency))
 
+    def register_singletons(self, factories: dict[type, Callable[..., Any]]) -> None:
+        # Bulk form of register_singleton for registering many defaults at once.
+        self.dependencies.update(
+            (dependency_type, SingletonDependency(FactoryDependency(factory)))
+            for dependency_type, factory in factories.items()
+        )
+        for dependency_type in factories:
+            self.resolved.pop(dependency_type, None)
+
 
 class ContextualBinding:
     def __init__(self, container: "DependencyContainer"):
         self.container = container
-        self.type_to_child_container: dict[type | None, DependencyContainer] = OrderedDict()
+        self.type_to_child_container: dict[type | None, DependencyContainer] = {}
 
     def container_for(self, context: type | None = None) -> "DependencyContainer":
         if context not in self.type_to_child_container:
@@ -130,7 +222,7 @@ class ContextualBinding:
         return self.container_for(context).resolve(type_to_resolve)
 
     def resolve_all_of_type(self, base: type[T]) -> list[T]:
-        return [self.resolve(t) for t in self.all_of_type(base)]
+        return list(map(self.resolve, self.all_of_type(base)))
 
     def all_of_type(self, base: type[T]) -> list[type[T]]:
         return [
@@ -139,6 +231,33 @@ class ContextualBinding:
             if c is not None and issubclass(c, base)
         ]
 
-    def resolve_all(self) -> list[T]:
-        # Resolve all dependencies registered in the root container
-        return [dep.resolve(self.container) for dep in self.container.dependencies.values()]
+    def all_of_type_with_containers(
+        self, base: type[T]
+    ) -> list[tuple[type[T], "DependencyContainer"]]:
+        # Pair types with their containers while walking the context map
+        # instead of looking each one up again via container_for(). The root
+        # dependencies are appended in place rather than concatenating a
+        # second list into a third.
+        matches = [
+            (c, container)
+            for c, container in self.type_to_child_container.items()
+            if c is not None and issubclass(c, base)
+        ]
+        matches.extend(
+            (c, self.container_for(c)) for c in self.container.dependencies if issubclass(c, base)
+        )
+        return matches
+
+    def resolve_all(self) -> list[Any]:
+        return list(self.resolve_each())
+
+    def resolve_each(self) -> Iterator[Any]:
+        # Resolve all dependencies registered in the root container. Going
+        # through resolve() means singletons already built as a dependency of
+        # an earlier entry are picked up from the resolved cache, so each
+        # node in the graph is built once and the pass stays O(N + E).
+        # Instances are yielded as they are resolved rather than collected,
+        # so callers that only warm up or iterate don't pay for a list.
+        container = self.container
+        for t in tuple(container.dependencies):
+            yield container.resolve(t)
@@ -7,7 +7,10 @@ framework components like aggregates, commands, services, etc.
 import importlib
 import inspect
 import pkgutil
+import sys
+import weakref
 from collections.abc import Iterable
+from importlib.machinery import ModuleSpec
 from types import ModuleType
 from typing import TypeVar
 
@@ -48,18 +51,62 @@ def _get_module_variants(name: str) -> list[str]:
     return [name, name + "s"]
 
 
-def _try_import_module(module_name: str) -> ModuleType | None:
+def _import_module(module_name: str) -> ModuleType:
+    """Import a module, reusing it from sys.modules if already imported.
+
+    Most modules found while scanning have already been imported (e.g. by
+    their package or an earlier scan), and a sys.modules lookup is far
+    cheaper than going through the import machinery.
+
+    Args:
+        module_name: Fully qualified module name
+
+    Returns:
+        The imported module
+
+    Raises:
+        ImportError: If the module cannot be imported
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
+
+
+def _iter_modules(path: tuple[str, ...]) -> tuple[tuple[str, bool], ...]:
+    """List the modules found on a package path.
+
+    Args:
+        path: The package's ``__path__`` entries
+
+    Returns:
+        (name, is_package) pairs for each module on the path
+    """
+    return tuple((name, is_pkg) for _, name, is_pkg in pkgutil.iter_modules(path))
+
+
+def _try_import_module(module_name: str, missing_modules: set[str]) -> ModuleType | None:
     """Try to import a module, returning None if it doesn't exist.
 
     Args:
         module_name: Fully qualified module name
+        missing_modules: Names of modules known not to exist. Checked before
+            importing and updated when the module itself is not found.
 
     Returns:
         Imported module or None if not found
     """
+    if module_name in missing_modules:
+        return None
     try:
-        return importlib.import_module(module_name)
-    except (ImportError, ModuleNotFoundError):
+        return _import_module(module_name)
+    except (ImportError, ModuleNotFoundError) as exc:
+        # Remember the miss so repeated scans skip the import machinery and
+        # the cost of raising and catching the ImportError again. Only the
+        # module itself being absent is remembered; an import failing inside
+        # it may be fixed and should be retried.
+        if exc.name == module_name:
+            missing_modules.add(module_name)
         return None
 
 
@@ -76,6 +123,8 @@ class ModuleScanner:
     - Private modules (_*.py, except __init__.py)
     """
 
+    __slots__ = ("_listings", "_missing_modules", "child_names", "package_name", "root_module")
+
     def __init__(self, package_name: str):
         """Initialize scanner for a package.
 
@@ -86,7 +135,30 @@ class ModuleScanner:
             ImportError: If the package cannot be imported
         """
         self.package_name = package_name
-        self.root_module = importlib.import_module(package_name)
+        self.root_module = _import_module(package_name)
+
+        # Package listings by __path__. Listing a package hits the
+        # filesystem, so repeated scans with this scanner (e.g. of nested
+        # packages reached from several subpackage names) are free.
+        self._listings: dict[tuple[str, ...], tuple[tuple[str, bool], ...]] = {}
+        # Subpackage names that turned out not to exist.
+        self._missing_modules: set[str] = set()
+
+        # Names of the package's direct children, so find_modules() only
+        # tries to import variants that exist instead of paying for a failed
+        # import (and the exception) for each missing one.
+        self.child_names = frozenset(name for name, _ in self._list_package(self.root_module))
+
+    def clear_cache(self) -> None:
+        """Forget the package listings and missing modules seen by this scanner.
+
+        Call this if modules were added to or removed from the package
+        after the scanner was created. The package's direct children are
+        listed again right away.
+        """
+        self._listings.clear()
+        self._missing_modules.clear()
+        self.child_names = frozenset(name for name, _ in self._list_package(self.root_module))
 
     def find_modules(self, subpackage: str) -> Iterable[ModuleType]:
         """Find all modules in a subpackage.
@@ -110,7 +182,10 @@ class ModuleScanner:
         """
         for variant in _get_module_variants(subpackage):
             module_path = f"{self.package_name}.{variant}"
-            module = _try_import_module(module_path)
+            if variant not in self.child_names and module_path not in sys.modules:
+                continue
+
+            module = _try_import_module(module_path, self._missing_modules)
 
             if module is None:
                 continue
@@ -150,15 +225,14 @@ class ModuleScanner:
         if not hasattr(package, "__path__"):
             return
 
-        for _importer, modname, is_pkg in pkgutil.iter_modules(
-            package.__path__, prefix=f"{package.__name__}."
-        ):
-            basename = modname.split(".")[-1]
+        for basename, is_pkg in self._list_package(package):
             if _should_skip_module(basename):
                 continue
 
+            modname = f"{package.__name__}.{basename}"
+
             try:
-                module = importlib.import_module(modname)
+                module = _import_module(modname)
                 yield module
 
                 if is_pkg:
@@ -170,6 +244,22 @@ class ModuleScanner:
                 )
                 raise ImportError(msg) from e
 
+    def _list_package(self, package: ModuleType) -> tuple[tuple[str, bool], ...]:
+        """List a package's modules, reusing this scanner's earlier listing.
+
+        Args:
+            package: Package module to list (modules without __path__ have
+                no children)
+
+        Returns:
+            (name, is_package) pairs for each module in the package
+        """
+        path = tuple(getattr(package, "__path__", ()))
+        listing = self._listings.get(path)
+        if listing is None:
+            listing = self._listings[path] = _iter_modules(path)
+        return listing
+
 
 class ClassScanner:
     """Extract classes from modules by type."""
@@ -199,9 +289,9 @@ class ClassScanner:
             BankAccount
             ShoppingCart
         """
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if _should_include_subclass(obj, name, base_class, module):
-                yield obj
+        for cls in _classes_defined_in(module):
+            if _should_include_subclass(cls, base_class):
+                yield cls
 
     @staticmethod
     def find_all_classes(module: ModuleType) -> Iterable[type]:
@@ -224,9 +314,7 @@ class ClassScanner:
             AuditService
             EmailService
         """
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if _should_include_class(obj, name, module):
-                yield obj
+        yield from _classes_defined_in(module)
 
     @staticmethod
     def get_registration_type(cls: type) -> type:
@@ -258,16 +346,87 @@ class ClassScanner:
             >>> ClassScanner.get_registration_type(ConcreteService)
             <class 'ConcreteService'>
         """
-        # Get all base classes (excluding object)
-        bases = [base for base in inspect.getmro(cls) if base not in (cls, object)]
+        return _registration_type(cls)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget the classes found in previously scanned modules."""
+        _module_classes.clear()
+        _registration_types.clear()
+
+
+# Results of _classes_defined_in, keyed by module. Each entry remembers the
+# module's __spec__, which importlib.reload() replaces, so a reloaded module
+# is walked again instead of returning its old classes.
+_module_classes: weakref.WeakKeyDictionary[
+    ModuleType, tuple[ModuleSpec | None, tuple[type, ...]]
+] = weakref.WeakKeyDictionary()
+
 
-        # Find first ABC or Protocol
-        for base in bases:
-            if inspect.isabstract(base) or getattr(base, "_is_protocol", False):
-                return base
+def _classes_defined_in(module: ModuleType) -> tuple[type, ...]:
+    """Get the public classes defined in a module.
+
+    Convention-based configuration scans the same modules once per base
+    class, so the member walk is cached per module and each scan only has
+    to apply its cheap subclass filter.
+
+    Args:
+        module: Module to scan
+
+    Returns:
+        Classes defined in the module (not imported), excluding private ones
+    """
+    spec = module.__spec__
+    cached = _module_classes.get(module)
+    if cached is not None and cached[0] is spec:
+        return cached[1]
+
+    # vars() avoids getmembers()'s getattr() per name and its sort; classes
+    # come back in definition order.
+    classes = tuple(
+        obj
+        for name, obj in vars(module).items()
+        if isinstance(obj, type) and _should_include_class(obj, name, module)
+    )
+    _module_classes[module] = (spec, classes)
+    return classes
 
-        # No interface found, use concrete type
-        return cls
+
+# Results of _registration_type, keyed by class. Weak keys, so caching a
+# class does not keep it (and its module) alive.
+_registration_types: weakref.WeakKeyDictionary[type, type] = weakref.WeakKeyDictionary()
+
+
+def _registration_type(cls: type) -> type:
+    """Find the registration type of a class (see get_registration_type).
+
+    A class's MRO and the abstractness of its bases never change, so the
+    result is cached per class.
+
+    Args:
+        cls: Class to determine registration type for
+
+    Returns:
+        Type to use for DI registration
+    """
+    cached = _registration_types.get(cls)
+    if cached is not None:
+        return cached
+
+    # Get all base classes (excluding object)
+    bases = [base for base in inspect.getmro(cls) if base not in (cls, object)]
+
+    # Find first ABC or Protocol, falling back to the concrete type
+    result = next(
+        (
+            base
+            for base in bases
+            if inspect.isabstract(base) or getattr(base, "_is_protocol", False)
+        ),
+        cls,
+    )
+    _registration_types[cls] = result
+    return result
 
 
 def _should_include_class(cls: type, name: str, module: ModuleType) -> bool:
@@ -284,22 +443,14 @@ def _should_include_class(cls: type, name: str, module: ModuleType) -> bool:
     return not name.startswith("_") and cls.__module__ == module.__name__
 
 
-def _should_include_subclass(cls: type, name: str, base_class: type, module: ModuleType) -> bool:
-    """Check if a subclass should be included in results.
+def _should_include_subclass(cls: type, base_class: type) -> bool:
+    """Check if a public class defined in a module is a wanted subclass.
 
     Args:
         cls: Class to check
-        name: Name of the class
         base_class: Base class being searched for
-        module: Module being scanned
 
     Returns:
         True if subclass should be included
     """
-    return (
-        issubclass(cls, base_class)
-        and cls is not base_class
-        and not name.startswith("_")
-        and not inspect.isabstract(cls)
-        and cls.__module__ == module.__name__
-    )
+    return issubclass(cls, base_class) and cls is not base_class and not inspect.isabstract(cls)
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import timedelta
 
+_ZERO = timedelta(0)
+
 
 @dataclass(frozen=True, slots=True)
 class Lag:
@@ -73,6 +75,8 @@ class CatchupCondition(ABC):
     - AnyOf/AllOf: Combine multiple conditions with OR/AND logic
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def should_catchup(self, lag: Lag) -> bool:
         """Evaluate whether catchup should be triggered.
@@ -104,6 +108,8 @@ class Never(CatchupCondition):
         ... )
     """
 
+    __slots__ = ()
+
     def should_catchup(self, lag: Lag) -> bool:
         """Always returns False - catchup never triggered.
 
@@ -132,6 +138,8 @@ class AfterNEvents(CatchupCondition):
         ...     await strategy.catchup()
     """
 
+    __slots__ = ("n",)
+
     def __init__(self, n: int):
         """Initialize with event count threshold.
 
@@ -170,13 +178,15 @@ class AfterNAge(CatchupCondition):
         ...     await strategy.catchup()
     """
 
+    __slots__ = ("age",)
+
     def __init__(self, age: timedelta):
         """Initialize with age threshold.
 
         Args:
             age: Maximum average event age before triggering catchup
         """
-        if age.total_seconds() <= 0:
+        if age <= _ZERO:
             raise ValueError("Age threshold must be positive")
         self.age = age
 
@@ -206,6 +216,8 @@ class AnyOf(CatchupCondition):
         ... )
     """
 
+    __slots__ = ("_predicates", "conditions")
+
     def __init__(self, *conditions: CatchupCondition):
         """Initialize with conditions to evaluate.
 
@@ -214,7 +226,13 @@ class AnyOf(CatchupCondition):
         """
         if not conditions:
             raise ValueError("Must provide at least one condition")
-        self.conditions = conditions
+        # Nested AnyOfs are merged into this one, since OR is associative, and
+        # the bound predicates are captured up front so evaluating the
+        # condition is a flat loop over plain calls.
+        self.conditions: tuple[CatchupCondition, ...] = tuple(
+            nested for c in conditions for nested in (c.conditions if type(c) is AnyOf else (c,))
+        )
+        self._predicates = tuple(c.should_catchup for c in self.conditions)
 
     def should_catchup(self, lag: Lag) -> bool:
         """Check if any condition is satisfied.
@@ -225,7 +243,10 @@ class AnyOf(CatchupCondition):
         Returns:
             True if any condition returns True
         """
-        return any(c.should_catchup(lag) for c in self.conditions)
+        for predicate in self._predicates:  # noqa: SIM110 - no generator per call
+            if predicate(lag):
+                return True
+        return False
 
 
 class AllOf(CatchupCondition):
@@ -242,6 +263,8 @@ class AllOf(CatchupCondition):
         ... )
     """
 
+    __slots__ = ("_predicates", "conditions")
+
     def __init__(self, *conditions: CatchupCondition):
         """Initialize with conditions to evaluate.
 
@@ -250,7 +273,13 @@ class AllOf(CatchupCondition):
         """
         if not conditions:
             raise ValueError("Must provide at least one condition")
-        self.conditions = conditions
+        # Nested AllOfs are merged into this one, since AND is associative, and
+        # the bound predicates are captured up front so evaluating the
+        # condition is a flat loop over plain calls.
+        self.conditions: tuple[CatchupCondition, ...] = tuple(
+            nested for c in conditions for nested in (c.conditions if type(c) is AllOf else (c,))
+        )
+        self._predicates = tuple(c.should_catchup for c in self.conditions)
 
     def should_catchup(self, lag: Lag) -> bool:
         """Check if all conditions are satisfied.
@@ -261,4 +290,7 @@ class AllOf(CatchupCondition):
         Returns:
             True if all conditions return True
         """
-        return all(c.should_catchup(lag) for c in self.conditions)
+        for predicate in self._predicates:  # noqa: SIM110 - no generator per call
+            if not predicate(lag):
+                return False
+        return True
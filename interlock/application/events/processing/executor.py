@@ -1,13 +1,17 @@
-from datetime import timedelta
-from typing import Generic, TypeVar
+import asyncio
+from datetime import timedelta, timezone
+from time import time
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from ....context import ExecutionContext, clear_context, set_context
-from ....domain import utc_now
 from ..transport import EventSubscription
 from .conditions import CatchupCondition, Lag
 from .processor import EventProcessor
 from .strategies import CatchupResult, CatchupStrategy
 
+if TYPE_CHECKING:
+    from ....domain import Event
+
 P = TypeVar("P", bound=EventProcessor)
 
 
@@ -28,6 +32,12 @@ class EventProcessorExecutor(Generic[P]):
     Events are processed in batches to improve throughput. After each
     batch, lag metrics are calculated to determine if catchup is needed.
 
+    A batch ends once `batch_size` events have been processed or, when
+    `max_batch_delay` is set, once that much time has passed since the batch
+    started. The delay bounds how long lag checks can be postponed when
+    events trickle in slowly. A read still waiting when the delay runs out
+    is not cancelled; its event starts the next batch.
+
     **Lag Monitoring:**
     After each batch, the executor measures:
     - Unprocessed events (subscription depth)
@@ -44,6 +54,7 @@ class EventProcessorExecutor(Generic[P]):
         condition: Condition for triggering catchup
         strategy: Strategy for catching up when triggered
         batch_size: Number of events to process before checking lag
+        max_batch_delay: Maximum time to spend filling a batch (Optional)
 
     Note:
         The run() method runs indefinitely until interrupted. Use asyncio
@@ -55,6 +66,8 @@ class EventProcessorExecutor(Generic[P]):
         "condition",
         "strategy",
         "batch_size",
+        "max_batch_delay",
+        "_pending_reads",
     )
 
     def __init__(
@@ -63,6 +76,7 @@ class EventProcessorExecutor(Generic[P]):
         condition: CatchupCondition,
         strategy: CatchupStrategy[P],
         batch_size: int = 1000,
+        max_batch_delay: timedelta | None = None,
     ) -> None:
         """Initialize the executor with its dependencies.
 
@@ -71,16 +85,24 @@ class EventProcessorExecutor(Generic[P]):
             condition: When to trigger catchup
             strategy: How to catch up when triggered
             batch_size: Events to process per batch (must be > 0)
+            max_batch_delay: Maximum time to wait for a batch to fill up
+                (must be > 0). None waits until batch_size events arrive.
 
         Raises:
-            ValueError: If batch_size <= 0
+            ValueError: If batch_size <= 0 or max_batch_delay <= 0
         """
         if batch_size <= 0:
             raise ValueError("batch_size must be positive")
+        if max_batch_delay is not None and max_batch_delay <= timedelta():
+            raise ValueError("max_batch_delay must be positive")
         self.processor = processor
         self.condition = condition
         self.strategy = strategy
         self.batch_size = batch_size
+        self.max_batch_delay = max_batch_delay
+        # next() calls still in flight when a batch's delay ran out, kept so
+        # the event they return is not lost.
+        self._pending_reads: dict[EventSubscription, asyncio.Future[Event[Any]]] = {}
 
     async def process_event_batch(
         self,
@@ -89,8 +111,11 @@ class EventProcessorExecutor(Generic[P]):
     ) -> timedelta:
         """Process a batch of events and calculate average event age.
 
-        Pulls batch_size events from the subscription, routes each to the
-        processor's handlers, and calculates the mean age of processed events.
+        Pulls up to batch_size events from the subscription, routes each to
+        the processor's handlers, and calculates the mean age of processed
+        events. If max_batch_delay is set, the batch is cut short once the
+        delay has elapsed, even if fewer than batch_size events arrived. A
+        read still waiting at that point delivers the next batch's first event.
 
         If a catchup_result is provided, events in the skip window are skipped
         to avoid double-processing events that were already incorporated during
@@ -115,12 +140,57 @@ class EventProcessorExecutor(Generic[P]):
             StopAsyncIteration: If subscription ends.
             Exception: Any exceptions raised by event handlers.
         """
-        total_lag_time = timedelta()
+        # Ages are summed as float seconds and converted to a timedelta once
+        # at the end, instead of building a datetime and two timedeltas for
+        # every event in the batch.
+        total_lag_seconds = 0.0
         events_processed = 0
 
+        loop = asyncio.get_running_loop()
+        deadline = None
+        if self.max_batch_delay is not None:
+            deadline = loop.time() + self.max_batch_delay.total_seconds()
+
+        # Number of events known to be readable without blocking. While this
+        # is positive we can call next() directly; a task for the read (and a
+        # timer to wait on it) is only needed once the stream is drained.
+        available = 0
+        pending = self._pending_reads.pop(subscription, None)
+
         for _ in range(self.batch_size):
-            event = await subscription.next()
-            total_lag_time += utc_now() - event.timestamp
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                if pending is None:
+                    if available == 0:
+                        available = await subscription.depth()
+                    if available > 0:
+                        available -= 1
+                    else:
+                        pending = asyncio.ensure_future(subscription.next())
+                if pending is not None:
+                    try:
+                        done, _ = await asyncio.wait((pending,), timeout=remaining)
+                    except asyncio.CancelledError:
+                        pending.cancel()
+                        raise
+                    if not done:
+                        break
+
+            if pending is None:
+                event = await subscription.next()
+            else:
+                event = await pending
+                pending = None
+
+            timestamp = event.timestamp
+            if timestamp.tzinfo is None:
+                # Stores may hand back naive datetimes (e.g. MongoDB without
+                # tz_aware); event timestamps are always UTC, so don't let
+                # timestamp() read them as local time.
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            total_lag_seconds += time() - timestamp.timestamp()
 
             # Skip events in the skip window (already processed during catchup)
             if catchup_result and catchup_result.should_skip(event):
@@ -150,11 +220,16 @@ class EventProcessorExecutor(Generic[P]):
                 if context_set:
                     clear_context()
 
+        # A read that outlived the delay delivers the first event of the next
+        # batch instead of being cancelled and losing its event.
+        if pending is not None:
+            self._pending_reads[subscription] = pending
+
         # If we didn't process any events, avoid division by zero
         if events_processed == 0:
             return timedelta()
 
-        return total_lag_time / events_processed
+        return timedelta(seconds=total_lag_seconds / events_processed)
 
     async def process_batch_and_check_catchup(
         self,
@@ -222,8 +297,13 @@ class EventProcessorExecutor(Generic[P]):
         # Execute initial catchup at startup
         catchup_result = await self.strategy.catchup(self.processor)
 
-        while True:
-            catchup_result = await self.process_batch_and_check_catchup(
-                subscription=subscription,
-                catchup_result=catchup_result,
-            )
+        try:
+            while True:
+                catchup_result = await self.process_batch_and_check_catchup(
+                    subscription=subscription,
+                    catchup_result=catchup_result,
+                )
+        finally:
+            pending = self._pending_reads.pop(subscription, None)
+            if pending is not None:
+                pending.cancel()
@@ -120,6 +120,18 @@ class EventProcessor:
         super().__init_subclass__(**kwargs)
         cls._event_router = setup_event_handling(cls)
 
+    @classmethod
+    def handled_event_types(cls) -> tuple[type, ...]:
+        """Get the event payload types this processor has handlers for.
+
+        Events of any other type are ignored by handle(), so transports can
+        use this to avoid delivering them in the first place.
+
+        Returns:
+            The payload types registered via @handles_event.
+        """
+        return cls._event_router.registered_types
+
     async def handle(self, event: Event[BaseModel] | BaseModel) -> object:
         """Route an event to its registered handler method.
 
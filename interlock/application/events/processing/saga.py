@@ -109,6 +109,21 @@ class SagaStateStore(ABC):
         """
         ...
 
+    async def complete_step(self, saga_id: str, step_name: str, state: BaseModel) -> None:
+        """Mark a saga step as completed and save the state it produced.
+
+        Called after a step returns new state. Stores that can record both in
+        a single write should override this; the default calls
+        `mark_step_complete` and then `save`.
+
+        Args:
+            saga_id: Unique identifier for the saga instance
+            step_name: Name of the step to mark complete
+            state: The state to save
+        """
+        await self.mark_step_complete(saga_id, step_name)
+        await self.save(saga_id, state)
+
 
 class InMemorySagaStateStore(SagaStateStore):
     """In-memory saga state store for development and testing.
@@ -309,6 +324,10 @@ class SagaStepExecutor(ABC):
     async def mark_step_completed(self, saga: Saga[Any], saga_id: str) -> None:
         """Mark step as complete and log."""
         await saga.state_store.mark_step_complete(saga_id, self.step_name)
+        self.log_step_completed(saga_id)
+
+    def log_step_completed(self, saga_id: str) -> None:
+        """Log that this step completed for a saga."""
         self.logger.info(f"Step '{self.step_name}' completed for saga {saga_id}")
 
     @abstractmethod
@@ -323,8 +342,13 @@ class SagaStepExecutor(ABC):
             if await self.check_idempotency(saga, saga_id):
                 return None
             result = await self.execute_handler(saga, event, saga_id)
-            await self.mark_step_completed(saga, saga_id)
-            await self.persist_state(saga, saga_id, result)
+            if isinstance(result, BaseModel):
+                # Record the step and its new state in one store call.
+                await saga.state_store.complete_step(saga_id, self.step_name, result)
+                self.log_step_completed(saga_id)
+            else:
+                await self.mark_step_completed(saga, saga_id)
+                await self.persist_state(saga, saga_id, result)
             return result
         except Exception as e:
             self.logger.error(f"Step '{self.step_name}' failed for saga {saga_id}: {e}")
@@ -1,7 +1,10 @@
 """Event store interfaces and implementations for durable event persistence."""
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from array import array
+from bisect import bisect_left
+from collections.abc import AsyncIterator
+from itertools import islice
 from typing import Any
 from uuid import UUID
 
@@ -48,6 +51,29 @@ class EventStore(ABC):
         """
         ...
 
+    async def save_events_batch(self, batches: list[tuple[list[Event[Any]], int]]) -> None:
+        """Persist several batches of events, e.g. for multiple aggregates.
+
+        Each batch is a list of events for one aggregate together with the
+        version that aggregate is expected to be at, as for `save_events`.
+        Batches for the same aggregate are applied in order. Stores that can
+        write all batches in a single round trip or transaction should
+        override this; the default saves each batch in turn.
+
+        Args:
+            batches: (events, expected_version) pairs to persist.
+
+        Raises:
+            ConcurrencyError: If any batch's expected_version doesn't match
+                the aggregate's version in the store.
+
+        Note:
+            The default implementation is not atomic across batches: batches
+            saved before a ConcurrencyError stay saved.
+        """
+        for events, expected_version in batches:
+            await self.save_events(events, expected_version)
+
     @abstractmethod
     async def load_events(
         self,
@@ -69,6 +95,30 @@ class EventStore(ABC):
         """
         ...
 
+    async def load_events_iter(
+        self,
+        aggregate_id: UUID,
+        min_version: int,
+    ) -> AsyncIterator[Event[Any]]:
+        """Load events for an aggregate for a single pass over them.
+
+        Like `load_events`, but yields the events one at a time for callers
+        that only iterate them once. Stores that can stream events (from
+        their own storage or a database cursor) should override this so the
+        whole stream is never copied into a list; the default yields the
+        result of `load_events`.
+
+        Args:
+            aggregate_id: The unique identifier of the aggregate whose
+                events should be loaded.
+            min_version: The minimum sequence number to load (inclusive).
+
+        Yields:
+            The events in sequence order.
+        """
+        for event in await self.load_events(aggregate_id, min_version):
+            yield event
+
     @abstractmethod
     async def rewrite_events(self, events: list[Event[Any]]) -> None:
         """Rewrite existing events in place for schema migration.
@@ -112,7 +162,11 @@ class InMemoryEventStore(EventStore):
 
     def __init__(self) -> None:
         """Initialize an empty in-memory event store."""
-        self.by_aggregate_id: dict[UUID, list[Event[Any]]] = defaultdict(list)
+        self.by_aggregate_id: dict[UUID, list[Event[Any]]] = {}
+        # Sequence numbers of each stream, kept in step with by_aggregate_id
+        # in a compact array. Version checks and lookups by sequence number
+        # only touch this column rather than the Event objects.
+        self.sequence_numbers: dict[UUID, array[int]] = {}
 
     async def save_events(
         self,
@@ -133,16 +187,69 @@ class InMemoryEventStore(EventStore):
 
         aggregate_id = events[0].aggregate_id
 
-        # Check current version matches expected
-        current_events = self.by_aggregate_id[aggregate_id]
-        current_version = current_events[-1].sequence_number if current_events else 0
+        # Check current version matches expected. Streams are plain dict
+        # entries, so checking an aggregate that has no events yet doesn't
+        # allocate an empty stream.
+        sequence_numbers = self.sequence_numbers.get(aggregate_id)
+        current_version = sequence_numbers[-1] if sequence_numbers else 0
 
         if current_version != expected_version:
             raise ConcurrencyError(f"Expected version {expected_version}, got {current_version}")
 
         # Version matches, safe to append events
-        for event in events:
-            self.by_aggregate_id[aggregate_id].append(event)
+        self._append(aggregate_id, sequence_numbers, events)
+
+    async def save_events_batch(self, batches: list[tuple[list[Event[Any]], int]]) -> None:
+        """Append several batches of events, checking every version first.
+
+        All batches are validated before anything is written, so either
+        every batch is stored or (on a ConcurrencyError) none are. Batches
+        for the same aggregate are grouped into a single append.
+
+        Args:
+            batches: (events, expected_version) pairs to store.
+
+        Raises:
+            ConcurrencyError: If any batch's expected_version doesn't match
+                the aggregate's version (including earlier batches in the call)
+        """
+        versions: dict[UUID, int] = {}
+        appends: dict[UUID, list[Event[Any]]] = {}
+        for events, expected_version in batches:
+            if not events:
+                continue
+
+            aggregate_id = events[0].aggregate_id
+            current_version = versions.get(aggregate_id)
+            if current_version is None:
+                sequence_numbers = self.sequence_numbers.get(aggregate_id)
+                current_version = sequence_numbers[-1] if sequence_numbers else 0
+
+            if current_version != expected_version:
+                raise ConcurrencyError(
+                    f"Expected version {expected_version}, got {current_version}"
+                )
+
+            versions[aggregate_id] = events[-1].sequence_number
+            appends.setdefault(aggregate_id, []).extend(events)
+
+        for aggregate_id, events in appends.items():
+            self._append(aggregate_id, self.sequence_numbers.get(aggregate_id), events)
+
+    def _append(
+        self,
+        aggregate_id: UUID,
+        sequence_numbers: "array[int] | None",
+        events: list[Event[Any]],
+    ) -> None:
+        # Callers pass the stream's sequence numbers they already looked up
+        # for the version check, so the stream is only hashed once per save.
+        if sequence_numbers is None:
+            self.by_aggregate_id[aggregate_id] = list(events)
+            self.sequence_numbers[aggregate_id] = array("q", [e.sequence_number for e in events])
+        else:
+            self.by_aggregate_id[aggregate_id].extend(events)
+            sequence_numbers.extend(event.sequence_number for event in events)
 
     async def load_events(
         self,
@@ -159,11 +266,38 @@ class InMemoryEventStore(EventStore):
             List of events with sequence_number >= min_version, in order.
             Returns empty list if aggregate has no events.
         """
-        return [
-            event
-            for event in self.by_aggregate_id[aggregate_id]
-            if event.sequence_number >= min_version
-        ]
+        sequence_numbers = self.sequence_numbers.get(aggregate_id)
+        if not sequence_numbers:
+            return []
+
+        # Streams are ordered by sequence number, so the first event to load
+        # can be found by bisecting the sequence number column and the rest
+        # copied as one slice rather than comparing every event in the stream.
+        start = bisect_left(sequence_numbers, min_version)
+        return self.by_aggregate_id[aggregate_id][start:]
+
+    async def load_events_iter(
+        self,
+        aggregate_id: UUID,
+        min_version: int,
+    ) -> AsyncIterator[Event[Any]]:
+        """Iterate events for an aggregate without copying the stream.
+
+        Args:
+            aggregate_id: The aggregate whose events to load
+            min_version: Minimum sequence number (inclusive). Use 0 for all events.
+
+        Yields:
+            The stored events with sequence_number >= min_version. Events
+            appended to the stream while iterating are included.
+        """
+        sequence_numbers = self.sequence_numbers.get(aggregate_id)
+        if not sequence_numbers:
+            return
+
+        start = bisect_left(sequence_numbers, min_version)
+        for event in islice(self.by_aggregate_id[aggregate_id], start, None):
+            yield event
 
     async def rewrite_events(self, events: list[Event[Any]]) -> None:
         """Rewrite existing events in place.
@@ -175,9 +309,10 @@ class InMemoryEventStore(EventStore):
             events: Events with updated data to write back.
         """
         for event in events:
-            stream = self.by_aggregate_id[event.aggregate_id]
+            sequence_numbers = self.sequence_numbers.get(event.aggregate_id)
+            if not sequence_numbers:
+                continue
             # Find and replace the event at this sequence number
-            for i, stored_event in enumerate(stream):
-                if stored_event.sequence_number == event.sequence_number:
-                    stream[i] = event
-                    break
+            i = bisect_left(sequence_numbers, event.sequence_number)
+            if i < len(sequence_numbers) and sequence_numbers[i] == event.sequence_number:
+                self.by_aggregate_id[event.aggregate_id][i] = event
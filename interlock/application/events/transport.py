@@ -7,7 +7,9 @@ This module provides:
 - InMemoryEventSubscription: Index-based subscription for in-memory transport
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from itertools import islice
 from typing import Any
 
 from ...domain import Event
@@ -94,6 +96,28 @@ class EventTransport(ABC):
         """
         ...
 
+    async def subscribe_to_types(
+        self,
+        identifier: str,
+        event_types: tuple[type, ...],
+    ) -> EventSubscription:
+        """Create a subscription that only needs events of the given types.
+
+        Transports that can filter on the subscriber's side (e.g. by routing
+        key or topic) should override this to avoid delivering events the
+        subscriber would ignore. The default subscribes to the full stream.
+
+        Args:
+            identifier: Stream identifier, as for subscribe().
+            event_types: Event payload types the subscriber handles. Events
+                whose data is an instance of one of these types must be
+                delivered; others may be skipped.
+
+        Returns:
+            An EventSubscription for consuming events from the stream.
+        """
+        return await self.subscribe(identifier)
+
     @abstractmethod
     async def publish_events(self, events: list[Event[Any]]) -> None:
         """Publish events to subscribers.
@@ -120,12 +144,14 @@ class InMemoryEventTransport(EventTransport):
     - Per-stream isolation (all subscriptions see all events)
     - Concurrent access (no thread safety)
     - Backpressure or buffering limits
-    - Event filtering by aggregate or type
+    - Event filtering by aggregate (see subscribe_to_types for types)
     """
 
     def __init__(self) -> None:
         """Initialize an empty in-memory transport."""
         self.events_in_order: list[Event[Any]] = []
+        # Futures of subscriptions waiting for the next publish.
+        self._waiters: list[asyncio.Future[None]] = []
 
     async def subscribe(self, identifier: str) -> EventSubscription:
         """Create a subscription to the global event stream.
@@ -142,6 +168,22 @@ class InMemoryEventTransport(EventTransport):
         """
         return InMemoryEventSubscription(self)
 
+    async def subscribe_to_types(
+        self,
+        identifier: str,
+        event_types: tuple[type, ...],
+    ) -> EventSubscription:
+        """Create a subscription that skips events of other payload types.
+
+        Args:
+            identifier: Identifier is ignored - all subscriptions share the global stream
+            event_types: Event payload types to deliver
+
+        Returns:
+            A new InMemoryEventSubscription filtered to the given types
+        """
+        return InMemoryEventSubscription(self, event_types)
+
     async def publish_events(self, events: list[Event[Any]]) -> None:
         """Append events to the global event stream.
 
@@ -149,10 +191,30 @@ class InMemoryEventTransport(EventTransport):
             events: Events to publish to all subscribers
 
         Note:
-            Events are immediately available to all subscriptions.
+            Events are immediately available to all subscriptions, and
+            subscriptions waiting in next() are woken up.
             No validation or filtering is performed.
         """
         self.events_in_order.extend(events)
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait_for_events(self) -> None:
+        """Wait until the next call to publish_events().
+
+        If the wait is cancelled, the waiter is dropped right away rather
+        than lingering until the next publish.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
 
 
 class InMemoryEventSubscription(EventSubscription):
@@ -161,38 +223,74 @@ class InMemoryEventSubscription(EventSubscription):
     Maintains a read position (index) in the transport's global event list.
     Each call to next() advances the index and returns the event at that position.
 
+    If event_types is given, events whose data is not an instance of one
+    of those types are skipped over rather than returned.
+
+    Once the end of the stream is reached, next() waits for the transport
+    to publish more events rather than raising, as the EventSubscription
+    contract allows. Cancel the call (or the task awaiting it) to stop
+    waiting.
+
     Limitations:
     - No thread safety (concurrent access will cause issues)
-    - Raises IndexError if reading past end of stream
-    - No blocking - fails immediately if no events available
     """
 
-    def __init__(self, transport: InMemoryEventTransport) -> None:
+    def __init__(
+        self,
+        transport: InMemoryEventTransport,
+        event_types: tuple[type, ...] | None = None,
+    ) -> None:
         """Initialize a subscription at the beginning of the stream.
 
         Args:
             transport: The transport containing the event stream
+            event_types: Event payload types to deliver (Optional, all if None)
         """
         self.index = 0
         self.transport = transport
+        self.event_types = event_types
+        # For filtered subscriptions, depth() counts matching events up to
+        # _scanned once and keeps the count up to date as they are read, so
+        # it only ever looks at newly published events.
+        self._scanned = 0
+        self._matching = 0
 
     async def depth(self) -> int:
         """Get the number of unread events.
 
         Returns:
-            Count of events from current position to end of stream
+            Count of (matching) events from current position to end of stream
         """
-        return len(self.transport.events_in_order) - self.index
+        events = self.transport.events_in_order
+        if self.event_types is None:
+            return len(events) - self.index
+        for event in islice(events, max(self._scanned, self.index), None):
+            if isinstance(event.data, self.event_types):
+                self._matching += 1
+        self._scanned = len(events)
+        return self._matching
 
     async def next(self) -> Event[Any]:
         """Read the next event and advance the subscription position.
 
-        Returns:
-            The event at the current index position
+        Waits for new events to be published if the end of the stream has
+        been reached; it never raises for a drained stream. Cancel the call
+        to stop waiting.
 
-        Raises:
-            IndexError: If attempting to read past the end of the stream
+        Returns:
+            The event at the current index position (the next matching one
+            when filtered)
         """
-        event = self.transport.events_in_order[self.index]
-        self.index += 1
-        return event
+        events = self.transport.events_in_order
+        event_types = self.event_types
+        while True:
+            while self.index < len(events):
+                event = events[self.index]
+                self.index += 1
+                if event_types is None:
+                    return event
+                if isinstance(event.data, event_types):
+                    if self.index <= self._scanned:
+                        self._matching -= 1
+                    return event
+            await self.transport.wait_for_events()
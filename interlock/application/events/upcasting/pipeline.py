@@ -1,6 +1,8 @@
+import functools
 from abc import ABC, abstractmethod
 from asyncio import gather
-from typing import Any, Generic, TypeVar, get_args
+from collections.abc import Awaitable, Callable
+from typing import Any, ClassVar, Generic, TypeVar, get_args
 
 from pydantic import BaseModel
 
@@ -11,13 +13,15 @@ T = TypeVar("T", bound=BaseModel)
 U = TypeVar("U", bound=BaseModel)
 
 
+@functools.cache
 def extract_upcaster_types(
     upcaster_class: type,
 ) -> tuple[type[BaseModel], type[BaseModel]]:
     """Extract source and target event types from an EventUpcaster subclass.
 
     Introspects the generic type parameters of EventUpcaster[T, U] to determine
-    which event types this upcaster transforms.
+    which event types this upcaster transforms. Results are cached per class,
+    since a class's generic bases never change.
 
     Args:
         upcaster_class: The EventUpcaster subclass to introspect
@@ -87,6 +91,22 @@ class EventUpcaster(Generic[T, U], ABC):
         ...         )
     """
 
+    # Whether can_upcast is the default, which accepts every event. Set per
+    # subclass so the pipeline can skip awaiting it.
+    _can_upcast_is_trivial: ClassVar[bool] = True
+    # The source and target types from EventUpcaster[T, U], extracted once
+    # when the subclass is defined. None when the class doesn't bind them.
+    _source_type: ClassVar[type[BaseModel] | None] = None
+    _target_type: ClassVar[type[BaseModel] | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._can_upcast_is_trivial = cls.can_upcast is EventUpcaster.can_upcast
+        try:
+            cls._source_type, cls._target_type = extract_upcaster_types(cls)
+        except ValueError:
+            cls._source_type = cls._target_type = None
+
     async def upcast_event(self, event: Event[T]) -> Event[U]:
         """Transform an entire event from old schema to new schema.
 
@@ -100,7 +120,10 @@ class EventUpcaster(Generic[T, U], ABC):
         Returns:
             A new event with transformed data
         """
-        return Event(
+        # The metadata comes from an already validated event and the payload
+        # from upcast_payload, so the envelope is built without re-running
+        # validation on every field.
+        return Event.model_construct(
             id=event.id,
             aggregate_id=event.aggregate_id,
             sequence_number=event.sequence_number,
@@ -139,6 +162,10 @@ class EventUpcaster(Generic[T, U], ABC):
         ...
 
 
+CanUpcast = Callable[[Event[Any]], Awaitable[bool]]
+UpcastEvent = Callable[[Event[Any]], Awaitable[Event[Any]]]
+
+
 class UpcasterMap:
     @staticmethod
     def from_upcasters(upcasters: list[EventUpcaster[Any, Any]]) -> "UpcasterMap":
@@ -152,12 +179,24 @@ class UpcasterMap:
 
     def __init__(self) -> None:
         self.upcasters: dict[type[BaseModel], list[EventUpcaster[Any, Any]]] = {}
+        # Per source type, the (can_upcast, upcast_event) bound methods of its
+        # upcasters in registration order, so the pipeline doesn't look the
+        # methods up again for every event it upcasts. can_upcast is None
+        # when the upcaster keeps the default, which accepts every event.
+        self.dispatch: dict[type[BaseModel], tuple[tuple[CanUpcast | None, UpcastEvent], ...]] = {}
 
     def register_upcaster(self, upcaster: EventUpcaster[Any, Any]) -> None:
-        source_type, _ = extract_upcaster_types(type(upcaster))
+        source_type = upcaster._source_type
+        if source_type is None:
+            # Raises a descriptive ValueError for unparameterized upcasters.
+            source_type, _ = extract_upcaster_types(type(upcaster))
         if source_type not in self.upcasters:
             self.upcasters[source_type] = []
         self.upcasters[source_type].append(upcaster)
+        self.dispatch[source_type] = tuple(
+            (None if u._can_upcast_is_trivial else u.can_upcast, u.upcast_event)
+            for u in self.upcasters[source_type]
+        )
 
     def get_upcasters(self, source_type: type[BaseModel]) -> list[EventUpcaster[Any, Any]]:
         return self.upcasters.get(source_type, [])
@@ -169,11 +208,22 @@ class UpcastingPipeline:
     The pipeline manages a mapping of upcasters and applies them to events
     based on the configured strategy. It supports multi-step upcasting chains
     where events can be transformed through multiple versions (V1→V2→V3).
+
+    Events are upcast concurrently in batches of ``batch_size`` so replaying
+    a long stream never schedules more than that many chains at once.
     """
 
-    def __init__(self, upcasting_strategy: UpcastingStrategy, upcaster_map: UpcasterMap):
+    def __init__(
+        self,
+        upcasting_strategy: UpcastingStrategy,
+        upcaster_map: UpcasterMap,
+        batch_size: int = 32,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self.upcasting_strategy = upcasting_strategy
         self.upcaster_map = upcaster_map
+        self.batch_size = batch_size
 
     async def upcast(self, event: Event[Any]) -> Event[Any]:
         """Apply upcasting transformations to a single event.
@@ -187,15 +237,10 @@ class UpcastingPipeline:
         Returns:
             The upcasted event, or the original if no upcaster found
         """
-        event_data_type = type(event.data)
-
-        # Find upcasters for this event type
-        for upcaster in self.upcaster_map.get_upcasters(event_data_type):
-            if await upcaster.can_upcast(event):
-                return await upcaster.upcast_event(event)
+        upcasted = await self._upcast_step(event)
 
         # No upcaster found - return unchanged
-        return event
+        return event if upcasted is None else upcasted
 
     async def upcast_chain(self, event: Event[Any], max_steps: int = 10) -> Event[Any]:
         """Apply upcasting transformations repeatedly until no more upcasters match.
@@ -215,7 +260,10 @@ class UpcastingPipeline:
         """
         for _step in range(max_steps):
             event_data_type = type(event.data)
-            upcasted = await self.upcast(event)
+            upcasted = await self._upcast_step(event)
+            if upcasted is None:
+                # No upcaster registered or matching, so the event is final.
+                return event
 
             # If type didn't change, we're done
             if type(upcasted.data) is event_data_type:
@@ -228,6 +276,20 @@ class UpcastingPipeline:
             f"Possible circular upcasting chain for {type(event.data).__name__}"
         )
 
+    async def _upcast_step(self, event: Event[Any]) -> Event[Any] | None:
+        """Apply the first matching upcaster for the event's data type.
+
+        Args:
+            event: The event to upcast
+
+        Returns:
+            The upcasted event, or None if no upcaster matched
+        """
+        for can_upcast, upcast_event in self.upcaster_map.dispatch.get(type(event.data), ()):
+            if can_upcast is None or await can_upcast(event):
+                return await upcast_event(event)
+        return None
+
     async def read_upcast(self, events: list[Event[Any]]) -> list[Event[Any]]:
         """Upcast events loaded from the event store according to the strategy.
 
@@ -238,7 +300,7 @@ class UpcastingPipeline:
             Upcasted events if strategy permits, otherwise original events
         """
         if self.upcasting_strategy.should_upcast_on_read():
-            return list(await gather(*[self.upcast_chain(event) for event in events]))
+            return await self._upcast_all(events)
         return events
 
     async def write_upcast(self, events: list[Event[Any]]) -> list[Event[Any]]:
@@ -251,5 +313,22 @@ class UpcastingPipeline:
             Upcasted events if strategy permits, otherwise original events
         """
         if self.upcasting_strategy.should_upcast_on_write():
-            return list(await gather(*[self.upcast_chain(event) for event in events]))
+            return await self._upcast_all(events)
         return events
+
+    async def _upcast_all(self, events: list[Event[Any]]) -> list[Event[Any]]:
+        # Most events are already at their current schema. Only events with
+        # an upcaster registered for their type get an upcast_chain coroutine;
+        # the rest are copied across without creating or scheduling anything.
+        # Chains are gathered a batch at a time so a long replay doesn't
+        # create a task for every event up front.
+        dispatch = self.upcaster_map.dispatch
+        pending = [i for i, event in enumerate(events) if type(event.data) in dispatch]
+        upcasted = list(events)
+        batch_size = self.batch_size
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            results = await gather(*[self.upcast_chain(events[i]) for i in batch])
+            for i, event in zip(batch, results, strict=True):
+                upcasted[i] = event
+        return upcasted
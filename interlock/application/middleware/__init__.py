@@ -6,7 +6,7 @@ They follow the chain of responsibility pattern and can intercept
 both commands (write side) and queries (read side).
 """
 
-from .base import Handler, Middleware
+from .base import Handler, Middleware, MiddlewareChains
 from .concurrency import ConcurrencyRetryMiddleware
 from .context import ContextPropagationMiddleware
 from .idempotency import (
@@ -23,6 +23,7 @@ __all__ = [
     # Base classes
     "Handler",
     "Middleware",
+    "MiddlewareChains",
     # Middleware implementations
     "ConcurrencyRetryMiddleware",
     "ContextPropagationMiddleware",
@@ -5,7 +5,7 @@ like logging, validation, authentication, or transaction management.
 """
 
 import inspect
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from pydantic import BaseModel
@@ -99,3 +99,72 @@ class Middleware:
             return await result
         else:
             return result
+
+
+class MiddlewareChains(dict[type, Handler]):
+    """Middleware chains of a bus, built per message type on first lookup.
+
+    Looking up a message type returns a handler that runs only the
+    middleware intercepting that type (or one of its bases) before the root
+    handler. Middleware that would just forward the message is left out
+    entirely. Each chain is built on the first lookup of its type and then
+    served straight from the dict.
+
+    Args:
+        root_handler: The handler at the end of every chain.
+        middleware: Middleware to apply (in order).
+    """
+
+    __slots__ = ("_intercepted_types", "middleware", "root_handler")
+
+    def __init__(self, root_handler: Handler, middleware: list[Middleware]) -> None:
+        super().__init__()
+        self.root_handler = root_handler
+        self.middleware = middleware
+        # The message types each middleware intercepts, read once here. None
+        # marks middleware that override intercept() and so always apply.
+        self._intercepted_types: list[frozenset[type] | None] = [
+            None
+            if type(mw).intercept is not Middleware.intercept
+            else frozenset(mw._command_router.registered_types)
+            for mw in middleware
+        ]
+
+    def warm_up(self, message_types: Iterable[type]) -> None:
+        """Build the chains for the given message types up front.
+
+        Args:
+            message_types: Message types to build chains for.
+        """
+        for message_type in message_types:
+            if message_type not in self:
+                self._build(message_type)
+
+    def __missing__(self, message_type: type) -> Handler:
+        return self._build(message_type)
+
+    def _build(self, message_type: type) -> Handler:
+        # A middleware applies if it intercepts the type or one of its bases.
+        # issubclass() rather than an MRO check, so that virtual subclasses
+        # (ABC.register()) match as they do in the middleware's own routing.
+        # This runs once per message type. The chain is reduced from right
+        # to left.
+        chain = self.root_handler
+        for mw, types in zip(
+            reversed(self.middleware), reversed(self._intercepted_types), strict=True
+        ):
+            if types is None or any(issubclass(message_type, t) for t in types):
+                chain = _link(mw, chain)
+        self[message_type] = chain
+        return chain
+
+
+def _link(middleware: Middleware, next_handler: Handler) -> Handler:
+    # The next handler is passed by position, as intercept() overrides may
+    # name that parameter anything.
+    intercept = middleware.intercept
+
+    def handle(message: BaseModel) -> Coroutine[Any, Any, Any]:
+        return intercept(message, next_handler)
+
+    return handle
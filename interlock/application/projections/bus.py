@@ -4,7 +4,7 @@ from collections.abc import Callable, Coroutine
 from typing import Any, TypeVar, cast
 
 from ...domain import Query
-from ..middleware import Handler, Middleware
+from ..middleware import Handler, Middleware, MiddlewareChains
 from .projection import Projection
 
 T = TypeVar("T")
@@ -155,6 +155,8 @@ class QueryBus:
         middleware: List of middleware to apply (in order).
     """
 
+    __slots__ = ("_chains", "middleware", "root_handler")
+
     def __init__(
         self,
         root_handler: DelegateToProjection,
@@ -162,17 +164,9 @@ class QueryBus:
     ):
         self.root_handler = root_handler
         self.middleware = middleware
-        # Build the middleware chain by reducing from right to left
-        # Use Handler type (BaseModel -> Coroutine) for middleware compatibility
-        chain: Handler = cast("Handler", self.root_handler.handle)
-        for mw in reversed(middleware):
-            prev_chain = chain
-
-            def make_chain(m: Middleware, n: Handler) -> Handler:
-                return lambda msg: m.intercept(msg, n)
-
-            chain = make_chain(mw, prev_chain)
-        self.chain = chain
+        # Chains holding only the middleware that intercept a given query
+        # type, built on first dispatch of that type.
+        self._chains = MiddlewareChains(cast("Handler", root_handler.handle), middleware)
 
     async def dispatch(self, query: Query[T]) -> T:
         """Dispatch query through the middleware chain to handler.
@@ -183,5 +177,5 @@ class QueryBus:
         Returns:
             The result from the query handler.
         """
-        result: T = await self.chain(query)
+        result: T = await self._chains[type(query)](query)
         return result
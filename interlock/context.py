@@ -3,7 +3,7 @@ from dataclasses import dataclass, replace
 from uuid import UUID, uuid4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionContext:
     """Immutable context for tracking request flow through the system.
 
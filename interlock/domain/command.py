@@ -3,13 +3,74 @@
 Commands represent intentions to change state and are dispatched to aggregates.
 """
 
+import os
+import threading
+import time
 from typing import Generic, TypeVar
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 TResponse = TypeVar("TResponse")
 
+_RANDOM_BITS = 74
+_monotonic_lock = threading.Lock()
+_last_ms = 0
+_last_random = 0
+
+
+def monotonic_uuid() -> UUID:
+    """Generate a time-ordered UUID that is monotonic within the process.
+
+    IDs use the UUIDv7 layout: a 48 bit millisecond timestamp followed by
+    74 random bits. IDs generated within the same millisecond increment the
+    random part of the previous ID instead of drawing new randomness, so
+    every ID sorts after the one before it. Ordered IDs append to the end of
+    database indexes rather than splitting pages at random positions.
+
+    Returns:
+        A new version 7 UUID.
+    """
+    global _last_ms, _last_random
+
+    ms = time.time_ns() // 1_000_000
+    with _monotonic_lock:
+        if ms <= _last_ms:
+            # Same millisecond (or the clock stepped back): stay ordered.
+            ms = _last_ms
+            rand = _last_random + 1
+            if rand >> _RANDOM_BITS:
+                ms += 1
+                rand = int.from_bytes(os.urandom(10), "big") >> 6
+        else:
+            rand = int.from_bytes(os.urandom(10), "big") >> 6
+        _last_ms, _last_random = ms, rand
+
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62) << 64
+        | 0b10 << 62
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)
+    )
+    return UUID(int=value)
+
+
+def _reset_monotonic_state() -> None:
+    # A forked child inherits the parent's last timestamp and random value,
+    # so continuing that sequence would hand out the same IDs as the parent.
+    # Forget them so the child draws fresh randomness, and replace the lock
+    # in case another thread held it at the time of the fork.
+    global _monotonic_lock, _last_ms, _last_random
+
+    _monotonic_lock = threading.Lock()
+    _last_ms = 0
+    _last_random = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_monotonic_state)
+
 
 class Command(BaseModel, Generic[TResponse]):
     """Base class for all commands in the system.
@@ -26,7 +87,9 @@ class Command(BaseModel, Generic[TResponse]):
         aggregate_id: UUID of the aggregate that should handle this command.
         correlation_id: Optional correlation ID for distributed tracing.
         causation_id: Optional ID of what caused this command.
-        command_id: Unique identifier for this command instance.
+        command_id: Unique identifier for this command instance. Defaults
+            to a time-ordered ID from `monotonic_uuid`, so command IDs sort
+            in creation order.
 
     Examples:
         Command that returns the new aggregate ID:
@@ -54,4 +117,4 @@ class Command(BaseModel, Generic[TResponse]):
     aggregate_id: UUID
     correlation_id: UUID | None = None
     causation_id: UUID | None = None
-    command_id: UUID = Field(default_factory=uuid4)
+    command_id: UUID = Field(default_factory=monotonic_uuid)
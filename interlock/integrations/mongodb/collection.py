@@ -126,7 +126,10 @@ class IndexedCollection:
         """
         self._collection = collection
         self._indexes = indexes or []
-        self._indexes_created = False
+        # Operations check this flag before awaiting ensure_indexes(), so
+        # once the indexes exist (or if there are none) no coroutine is
+        # created per operation just to find there is nothing to do.
+        self._indexes_created = not self._indexes
 
     async def ensure_indexes(self) -> None:
         """Create indexes if not already created.
@@ -158,7 +161,8 @@ class IndexedCollection:
         Returns:
             The matching document or None.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
         result: dict[str, Any] | None = await self._collection.find_one(
             filter, projection=projection
         )
@@ -169,6 +173,7 @@ class IndexedCollection:
         filter: dict[str, Any],
         sort: list[tuple[str, int]] | None = None,
         limit: int | None = None,
+        projection: dict[str, Any] | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
         """Find documents matching the filter.
 
@@ -176,13 +181,15 @@ class IndexedCollection:
             filter: MongoDB query filter.
             sort: Optional list of (field, direction) tuples.
             limit: Optional maximum number of documents to return.
+            projection: Optional projection to limit returned fields.
 
         Yields:
             Matching documents.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
 
-        cursor = self._collection.find(filter)
+        cursor = self._collection.find(filter, projection=projection)
 
         if sort:
             cursor = cursor.sort(sort)
@@ -196,19 +203,26 @@ class IndexedCollection:
         self,
         filter: dict[str, Any],
         sort_field: str,
+        projection: dict[str, Any] | None = None,
     ) -> dict[str, Any] | None:
         """Find the latest document by a sort field.
 
         Args:
             filter: MongoDB query filter.
             sort_field: Field to sort by descending.
+            projection: Optional projection to limit returned fields.
 
         Returns:
             The latest matching document or None.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
 
-        cursor = self._collection.find(filter).sort(sort_field, DESCENDING).limit(1)
+        cursor = (
+            self._collection.find(filter, projection=projection)
+            .sort(sort_field, DESCENDING)
+            .limit(1)
+        )
 
         async for doc in cursor:
             result: dict[str, Any] = doc
@@ -223,7 +237,8 @@ class IndexedCollection:
         Args:
             document: The document to insert.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
         await self._collection.insert_one(document)
 
     async def insert_many(
@@ -237,9 +252,27 @@ class IndexedCollection:
             documents: List of documents to insert.
             ordered: If True, stop on first error. If False, continue.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
         await self._collection.insert_many(documents, ordered=ordered)
 
+    # ========== Bulk Operations ==========
+
+    async def bulk_write(
+        self,
+        operations: list[Any],
+        ordered: bool = True,
+    ) -> None:
+        """Run several write operations in a single request.
+
+        Args:
+            operations: pymongo write operations (e.g. ReplaceOne, InsertOne).
+            ordered: If True, apply in order and stop on first error.
+        """
+        if not self._indexes_created:
+            await self.ensure_indexes()
+        await self._collection.bulk_write(operations, ordered=ordered)
+
     # ========== Update Operations ==========
 
     async def update_one(
@@ -258,7 +291,8 @@ class IndexedCollection:
         Returns:
             UpdateResult with modified_count and upserted_id.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
         result = await self._collection.update_one(filter, update, upsert=upsert)
         return UpdateResult(
             modified_count=result.modified_count,
@@ -278,7 +312,8 @@ class IndexedCollection:
             replacement: The new document.
             upsert: If True, insert if no matching document exists.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
         await self._collection.replace_one(filter, replacement, upsert=upsert)
 
     # ========== Delete Operations ==========
@@ -289,7 +324,8 @@ class IndexedCollection:
         Args:
             filter: MongoDB query filter.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
         await self._collection.delete_one(filter)
 
     # ========== Aggregation Operations ==========
@@ -310,7 +346,8 @@ class IndexedCollection:
         Yields:
             Distinct values.
         """
-        await self.ensure_indexes()
+        if not self._indexes_created:
+            await self.ensure_indexes()
 
         pipeline: list[dict[str, Any]] = []
         if filter:
@@ -320,3 +357,19 @@ class IndexedCollection:
         cursor = await self._collection.aggregate(pipeline)
         async for doc in cursor:
             yield doc["_id"]
+
+    async def aggregate(self, pipeline: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+        """Run an aggregation pipeline.
+
+        Args:
+            pipeline: The aggregation stages to run.
+
+        Yields:
+            Result documents.
+        """
+        if not self._indexes_created:
+            await self.ensure_indexes()
+
+        cursor = await self._collection.aggregate(pipeline)
+        async for doc in cursor:
+            yield doc
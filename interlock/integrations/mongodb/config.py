@@ -71,7 +71,9 @@ class MongoConfiguration(BaseSettings):
     # Idempotency TTL (seconds) - default 24 hours
     idempotency_ttl_seconds: int = 86400
 
-    model_config = {"env_prefix": "INTERLOCK_MONGO_"}
+    # Settings are read once and never change, so instances are frozen. The
+    # cached client, database and collections are unaffected by this.
+    model_config = {"env_prefix": "INTERLOCK_MONGO_", "frozen": True}
 
     @cached_property
     def client(self) -> AsyncMongoClient[dict[str, Any]]:
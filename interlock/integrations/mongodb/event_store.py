@@ -1,10 +1,12 @@
 """MongoDB implementation of EventStore."""
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel
+from pymongo import UpdateOne
 from pymongo.errors import DuplicateKeyError
 
 from interlock.application.events.store import EventStore
@@ -46,7 +48,9 @@ class EventDocument(BaseModel):
     @classmethod
     def from_value(cls, event: Event[Any]) -> "EventDocument":
         """Create a document from an Event."""
-        return cls(
+        # Every field is derived from an already validated Event, so the
+        # document is built without validating each field again.
+        return cls.model_construct(
             event_id=str(event.id),
             aggregate_id=str(event.aggregate_id),
             sequence_number=event.sequence_number,
@@ -61,7 +65,10 @@ class EventDocument(BaseModel):
         """Convert the document back to an Event."""
         event_type = load_type(self.event_type)
 
-        return Event(
+        # The document was validated when it was read and every field is
+        # converted to its final type here, so the envelope is built without
+        # validating it a second time. The payload is still validated.
+        return Event.model_construct(
             id=UUID(self.event_id),
             aggregate_id=UUID(self.aggregate_id),
             sequence_number=self.sequence_number,
@@ -134,15 +141,23 @@ class MongoEventStore(EventStore):
 
         aggregate_id = events[0].aggregate_id
 
-        # Verify expected version by checking current max sequence number
-        latest = await self._collection.find_latest(
-            {"aggregate_id": str(aggregate_id)},
-            sort_field="sequence_number",
-        )
-        current_version = latest["sequence_number"] if latest else 0
+        # A new stream starting at sequence number 1 needs no version read:
+        # if the aggregate already has events, inserting sequence number 1
+        # violates the unique stream index and raises below. Otherwise
+        # verify the expected version against the current max sequence
+        # number, fetching only that field rather than the event payload.
+        if expected_version != 0 or events[0].sequence_number != 1:
+            latest = await self._collection.find_latest(
+                {"aggregate_id": str(aggregate_id)},
+                sort_field="sequence_number",
+                projection={"_id": 0, "sequence_number": 1},
+            )
+            current_version = latest["sequence_number"] if latest else 0
 
-        if current_version != expected_version:
-            raise ConcurrencyError(f"Expected version {expected_version}, got {current_version}")
+            if current_version != expected_version:
+                raise ConcurrencyError(
+                    f"Expected version {expected_version}, got {current_version}"
+                )
 
         # Convert events to documents
         documents = [EventDocument.from_value(event).model_dump(mode="json") for event in events]
@@ -154,6 +169,78 @@ class MongoEventStore(EventStore):
                 f"Concurrent modification detected for aggregate {aggregate_id}"
             ) from e
 
+    async def save_events_batch(self, batches: list[tuple[list[Event[Any]], int]]) -> None:
+        """Persist several batches of events in two round trips.
+
+        The current version of every aggregate in the call is read with a
+        single aggregation and all versions are checked before anything is
+        written. The events are then inserted with one ordered insert_many.
+        Batches for the same aggregate are applied in order.
+
+        Args:
+            batches: (events, expected_version) pairs to persist.
+
+        Raises:
+            ConcurrencyError: If any batch's expected_version doesn't match
+                the aggregate's version (including earlier batches in the
+                call), or a concurrent writer inserted a conflicting event.
+
+        Note:
+            The insert is not transactional: if a concurrent writer causes a
+            duplicate key, events inserted before it stay saved.
+        """
+        # Expected version of each aggregate's first batch, keyed by the
+        # stored aggregate id, and the version its last batch leaves it at.
+        expected_versions: dict[str, int] = {}
+        versions: dict[str, int] = {}
+        documents: list[dict[str, Any]] = []
+        for events, expected_version in batches:
+            if not events:
+                continue
+
+            aggregate_id = str(events[0].aggregate_id)
+            current_version = versions.get(aggregate_id)
+            if current_version is None:
+                expected_versions[aggregate_id] = expected_version
+            elif current_version != expected_version:
+                raise ConcurrencyError(
+                    f"Expected version {expected_version}, got {current_version}"
+                )
+
+            versions[aggregate_id] = events[-1].sequence_number
+            documents.extend(
+                EventDocument.from_value(event).model_dump(mode="json") for event in events
+            )
+
+        if not documents:
+            return
+
+        current_versions = {
+            doc["_id"]: doc["sequence_number"]
+            async for doc in self._collection.aggregate(
+                [
+                    {"$match": {"aggregate_id": {"$in": list(expected_versions)}}},
+                    {
+                        "$group": {
+                            "_id": "$aggregate_id",
+                            "sequence_number": {"$max": "$sequence_number"},
+                        }
+                    },
+                ]
+            )
+        }
+        for aggregate_id, expected_version in expected_versions.items():
+            current_version = current_versions.get(aggregate_id, 0)
+            if current_version != expected_version:
+                raise ConcurrencyError(
+                    f"Expected version {expected_version}, got {current_version}"
+                )
+
+        try:
+            await self._collection.insert_many(documents, ordered=True)
+        except DuplicateKeyError as e:
+            raise ConcurrencyError("Concurrent modification detected while saving batch") from e
+
     async def load_events(
         self,
         aggregate_id: UUID,
@@ -168,30 +255,67 @@ class MongoEventStore(EventStore):
         Returns:
             List of events in sequence order.
         """
-        cursor = self._collection.find(
+        return [
+            EventDocument.model_validate(doc).to_value()
+            async for doc in self._find_events(aggregate_id, min_version)
+        ]
+
+    async def load_events_iter(
+        self,
+        aggregate_id: UUID,
+        min_version: int,
+    ) -> AsyncIterator[Event[Any]]:
+        """Load events for an aggregate, converting each one as the cursor yields it.
+
+        Documents are read from the cursor batch by batch, so neither the raw
+        documents nor the converted events of the whole stream are held at
+        once.
+
+        Args:
+            aggregate_id: The aggregate whose events to load.
+            min_version: Minimum sequence number (inclusive).
+
+        Yields:
+            The events in sequence order.
+        """
+        async for doc in self._find_events(aggregate_id, min_version):
+            yield EventDocument.model_validate(doc).to_value()
+
+    def _find_events(self, aggregate_id: UUID, min_version: int) -> AsyncIterator[dict[str, Any]]:
+        return self._collection.find(
             {
                 "aggregate_id": str(aggregate_id),
                 "sequence_number": {"$gte": min_version},
             },
             sort=[("sequence_number", IndexDirection.ASC)],
+            # EventDocument doesn't read _id, so skip decoding an ObjectId
+            # for every event.
+            projection={"_id": 0},
         )
 
-        return [EventDocument.model_validate(doc).to_value() async for doc in cursor]
-
     async def rewrite_events(self, events: list[Event[Any]]) -> None:
         """Rewrite existing events in place for schema migration.
 
-        Updates events by matching (aggregate_id, sequence_number).
+        Updates events by matching (aggregate_id, sequence_number). All
+        updates are sent in a single unordered bulk write, since each one
+        targets a different event.
 
         Args:
             events: Events with updated data to write back.
         """
+        if not events:
+            return
+
+        operations = []
         for event in events:
             doc = EventDocument.from_value(event).model_dump(mode="json")
-            await self._collection.update_one(
-                {
-                    "aggregate_id": str(event.aggregate_id),
-                    "sequence_number": event.sequence_number,
-                },
-                {"$set": doc},
+            operations.append(
+                UpdateOne(
+                    {
+                        "aggregate_id": doc["aggregate_id"],
+                        "sequence_number": doc["sequence_number"],
+                    },
+                    {"$set": doc},
+                )
             )
+        await self._collection.bulk_write(operations, ordered=False)
@@ -86,7 +86,7 @@ class MongoSagaStateStore(SagaStateStore):
         Returns:
             The saga state if found, None otherwise.
         """
-        doc = await self._collection.find_one({"_id": saga_id})
+        doc = await self._collection.find_one({"_id": saga_id}, projection={"_id": 0})
 
         if doc is None:
             return None
@@ -129,7 +129,8 @@ class MongoSagaStateStore(SagaStateStore):
         """Mark a saga step as completed (for idempotency).
 
         Uses MongoDB's $addToSet to atomically add the step name to the
-        completed_steps array if it doesn't already exist.
+        completed_steps array if it doesn't already exist. The update result
+        says whether the step was added, so no separate lookup is needed.
 
         Args:
             saga_id: Unique identifier for the saga instance.
@@ -138,11 +139,8 @@ class MongoSagaStateStore(SagaStateStore):
         Returns:
             True if newly marked, False if already complete.
         """
-        # First check if already complete
-        if await self.is_step_complete(saga_id, step_name):
-            return False
-
-        # Add to completed steps (upsert in case saga doesn't exist yet)
+        # Add to completed steps (upsert in case saga doesn't exist yet).
+        # $addToSet leaves the document unmodified if the step is present.
         result = await self._collection.update_one(
             {"_id": saga_id},
             {"$addToSet": {"completed_steps": step_name}},
@@ -153,6 +151,28 @@ class MongoSagaStateStore(SagaStateStore):
         # If upserted_id is set, it was a new document
         return result.modified_count > 0 or result.upserted_id is not None
 
+    async def complete_step(self, saga_id: str, step_name: str, state: BaseModel) -> None:
+        """Mark a saga step as completed and save its state in one update.
+
+        Args:
+            saga_id: Unique identifier for the saga instance.
+            step_name: Name of the step to mark complete.
+            state: The state to save.
+        """
+        state_doc = SagaStateDocument.from_value(state)
+
+        await self._collection.update_one(
+            {"_id": saga_id},
+            {
+                "$set": {
+                    "state_type": state_doc.state_type,
+                    "state": state_doc.state,
+                },
+                "$addToSet": {"completed_steps": step_name},
+            },
+            upsert=True,
+        )
+
     async def is_step_complete(self, saga_id: str, step_name: str) -> bool:
         """Check if a saga step has been completed.
 
@@ -5,6 +5,7 @@ from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, Field
+from pymongo import ReplaceOne
 
 from interlock.application.aggregates.repository.snapshot import (
     AggregateSnapshotStorageBackend,
@@ -18,6 +19,9 @@ from interlock.integrations.mongodb.collection import (
 from interlock.integrations.mongodb.config import MongoConfiguration
 from interlock.integrations.mongodb.type_loader import get_qualified_name, load_type
 
+# SnapshotDocument doesn't read _id, so loads leave it out of the result.
+SNAPSHOT_PROJECTION = {"_id": 0}
+
 
 class SnapshotDocument(BaseModel):
     """Aggregate snapshot document representation for MongoDB storage."""
@@ -68,6 +72,19 @@ class SnapshotStrategy(ABC):
         """Save a snapshot using this strategy."""
         ...
 
+    async def save_many(
+        self,
+        collection: IndexedCollection,
+        aggregates: list[Aggregate],
+    ) -> None:
+        """Save snapshots of several aggregates.
+
+        The default saves each aggregate in turn. Strategies that can write
+        all snapshots in one request should override this.
+        """
+        for aggregate in aggregates:
+            await self.save(collection, aggregate)
+
     @abstractmethod
     async def load(
         self,
@@ -105,13 +122,32 @@ class SingleSnapshotStrategy(SnapshotStrategy):
             upsert=True,
         )
 
+    async def save_many(
+        self,
+        collection: IndexedCollection,
+        aggregates: list[Aggregate],
+    ) -> None:
+        # Ordered, so a later snapshot of the same aggregate wins.
+        await collection.bulk_write(
+            [
+                ReplaceOne(
+                    {"aggregate_id": str(aggregate.id)},
+                    SnapshotDocument.from_value(aggregate).model_dump(mode="json"),
+                    upsert=True,
+                )
+                for aggregate in aggregates
+            ]
+        )
+
     async def load(
         self,
         collection: IndexedCollection,
         aggregate_id: UUID,
         intended_version: int | None,
     ) -> dict[str, Any] | None:
-        doc = await collection.find_one({"aggregate_id": str(aggregate_id)})
+        doc = await collection.find_one(
+            {"aggregate_id": str(aggregate_id)}, projection=SNAPSHOT_PROJECTION
+        )
         if doc is None:
             return None
 
@@ -150,6 +186,18 @@ class MultipleSnapshotStrategy(SnapshotStrategy):
         doc = SnapshotDocument.from_value(aggregate).model_dump(mode="json")
         await collection.insert_one(doc)
 
+    async def save_many(
+        self,
+        collection: IndexedCollection,
+        aggregates: list[Aggregate],
+    ) -> None:
+        await collection.insert_many(
+            [
+                SnapshotDocument.from_value(aggregate).model_dump(mode="json")
+                for aggregate in aggregates
+            ]
+        )
+
     async def load(
         self,
         collection: IndexedCollection,
@@ -160,7 +208,9 @@ class MultipleSnapshotStrategy(SnapshotStrategy):
         if intended_version is not None:
             filter_query["version"] = {"$lte": intended_version}
 
-        return await collection.find_latest(filter_query, sort_field="version")
+        return await collection.find_latest(
+            filter_query, sort_field="version", projection=SNAPSHOT_PROJECTION
+        )
 
 
 class MongoSnapshotStorage(AggregateSnapshotStorageBackend):
@@ -235,6 +285,18 @@ class MongoSnapshotStorage(AggregateSnapshotStorageBackend):
         """
         await self._strategy.save(self._collection, aggregate)
 
+    async def save_snapshots(self, aggregates: list[Aggregate]) -> None:
+        """Save snapshots of several aggregates in a single request.
+
+        Uses one bulk write of upserts in single mode and one insert_many in
+        multiple mode.
+
+        Args:
+            aggregates: The aggregates to save.
+        """
+        if aggregates:
+            await self._strategy.save_many(self._collection, aggregates)
+
     async def load_snapshot(
         self,
         aggregate_id: UUID,
@@ -6,7 +6,7 @@ domain objects.
 """
 
 import importlib
-from functools import lru_cache
+from functools import cache
 from typing import Any
 
 
@@ -27,12 +27,14 @@ def get_qualified_name(cls: type) -> str:
     return f"{cls.__module__}.{cls.__qualname__}"
 
 
-@lru_cache(maxsize=256)
+@cache
 def load_type(qualified_name: str) -> type[Any]:
     """Load a type from its fully qualified name.
 
     Uses Python's import machinery to dynamically load the type.
-    Results are cached for performance.
+    Results are cached for performance. The cache is unbounded since the
+    set of stored type names is fixed, so a hit is a plain dict lookup and
+    types are never evicted and re-imported.
 
     Args:
         qualified_name: The fully qualified name (module.ClassName).
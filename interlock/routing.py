@@ -219,6 +219,15 @@ class MessageRouter:
 
             self._dispatch.register(message_type)(payload_wrapper)
 
+    @property
+    def registered_types(self) -> tuple[type, ...]:
+        """Message types that have an explicitly registered handler.
+
+        Returns:
+            The registered message types, excluding the default handler.
+        """
+        return tuple(t for t in self._dispatch.registry if t is not object)
+
     def route(self, instance: Any, message: Any, *args: Any, **kwargs: Any) -> object:
         """Route a message to its registered handler.
 
@@ -13,32 +13,30 @@ nav = mkdocs_gen_files.Nav()
 src = Path(__file__).parent.parent / "interlock"
 
 for path in sorted(src.rglob("*.py")):
-    module_path = path.relative_to(src.parent)
-    doc_path = path.relative_to(src).with_suffix(".md")
-    full_doc_path = Path("reference", doc_path)
-
-    parts = tuple(module_path.with_suffix("").parts)
+    # Module path inside the package, e.g. ("domain", "event"). Everything
+    # else is derived from these parts with plain string joins rather than
+    # building several intermediate Path objects per file.
+    nav_parts = path.relative_to(src).with_suffix("").parts
 
     # Skip __pycache__ directories
-    if "__pycache__" in parts:
+    if "__pycache__" in nav_parts:
         continue
 
     # Handle __init__.py files
-    if parts[-1] == "__init__":
-        parts = parts[:-1]
-        if not parts:
-            continue
-        doc_path = doc_path.with_name("index.md")
-        full_doc_path = full_doc_path.with_name("index.md")
+    if nav_parts[-1] == "__init__":
+        nav_parts = nav_parts[:-1]
+        doc_path = "/".join((*nav_parts, "index.md"))
+    else:
+        doc_path = "/".join(nav_parts) + ".md"
+    full_doc_path = f"reference/{doc_path}"
 
     # Build navigation
-    nav_parts = parts[1:] if parts[0] == "interlock" else parts
     if nav_parts:
-        nav[nav_parts] = doc_path.as_posix()
+        nav[nav_parts] = doc_path
 
     # Generate the markdown file
     with mkdocs_gen_files.open(full_doc_path, "w") as fd:
-        ident = ".".join(parts)
+        ident = ".".join(("interlock", *nav_parts))
         fd.write(f"::: {ident}")
 
     mkdocs_gen_files.set_edit_path(full_doc_path, path)
@@ -91,6 +91,23 @@ async def test_load_events_with_min_version(event_store: MongoEventStore):
     assert loaded[1].sequence_number == 3
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_load_events_iter_matches_load_events(event_store: MongoEventStore):
+    """Test iterating events yields the same events as load_events."""
+    aggregate_id = uuid4()
+    events = [
+        Event(aggregate_id=aggregate_id, sequence_number=1, data=AccountCreated(owner="Kim")),
+        Event(aggregate_id=aggregate_id, sequence_number=2, data=MoneyDeposited(amount=5)),
+    ]
+    await event_store.save_events(events, expected_version=0)
+
+    iterated = [e async for e in event_store.load_events_iter(aggregate_id, min_version=2)]
+
+    assert iterated == await event_store.load_events(aggregate_id, min_version=2)
+    assert [e.sequence_number for e in iterated] == [2]
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_concurrency_error_on_version_mismatch(event_store: MongoEventStore):
@@ -177,6 +194,62 @@ async def test_save_multiple_batches(event_store: MongoEventStore):
     assert len(loaded) == 2
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_save_events_batch_for_several_aggregates(event_store: MongoEventStore):
+    """Test saving batches for several aggregates in one call."""
+    first, second = uuid4(), uuid4()
+    await event_store.save_events(
+        [Event(aggregate_id=first, sequence_number=1, data=AccountCreated(owner="Ann"))],
+        expected_version=0,
+    )
+
+    await event_store.save_events_batch(
+        [
+            (
+                [Event(aggregate_id=first, sequence_number=2, data=MoneyDeposited(amount=1))],
+                1,
+            ),
+            (
+                [Event(aggregate_id=second, sequence_number=1, data=AccountCreated(owner="Bo"))],
+                0,
+            ),
+            (
+                [Event(aggregate_id=first, sequence_number=3, data=MoneyDeposited(amount=2))],
+                2,
+            ),
+        ]
+    )
+
+    assert len(await event_store.load_events(first, min_version=0)) == 3
+    assert len(await event_store.load_events(second, min_version=0)) == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_save_events_batch_checks_versions_before_writing(
+    event_store: MongoEventStore,
+):
+    """Test that a version conflict in any batch writes nothing."""
+    first, second = uuid4(), uuid4()
+
+    with pytest.raises(ConcurrencyError):
+        await event_store.save_events_batch(
+            [
+                (
+                    [Event(aggregate_id=first, sequence_number=1, data=AccountCreated(owner="A"))],
+                    0,
+                ),
+                (
+                    [Event(aggregate_id=second, sequence_number=2, data=MoneyDeposited(amount=1))],
+                    1,
+                ),
+            ]
+        )
+
+    assert await event_store.load_events(first, min_version=0) == []
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_load_events_for_nonexistent_aggregate(event_store: MongoEventStore):
@@ -228,6 +301,28 @@ async def test_rewrite_events(event_store: MongoEventStore):
     assert loaded[0].data.owner == "Updated"
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_rewrite_several_events(event_store: MongoEventStore):
+    """Test rewriting several events at once only touches those events."""
+    aggregate_id = uuid4()
+    events = [
+        Event(aggregate_id=aggregate_id, sequence_number=n, data=AccountCreated(owner=f"V{n}"))
+        for n in (1, 2, 3)
+    ]
+    await event_store.save_events(events, expected_version=0)
+
+    await event_store.rewrite_events(
+        [
+            event.model_copy(update={"data": AccountCreated(owner="Updated")})
+            for event in (events[0], events[2])
+        ]
+    )
+
+    loaded = await event_store.load_events(aggregate_id, min_version=0)
+    assert [e.data.owner for e in loaded] == ["Updated", "V2", "Updated"]
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_events_preserve_correlation_and_causation_ids(
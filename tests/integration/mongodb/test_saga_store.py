@@ -88,6 +88,22 @@ async def test_mark_step_complete(saga_store: MongoSagaStateStore):
     assert was_new is False
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_complete_step(saga_store: MongoSagaStateStore):
+    """Test marking a step complete and saving state together."""
+    saga_id = "order-7"
+
+    state = CheckoutState(order_id=saga_id, status="reserved")
+
+    await saga_store.complete_step(saga_id, "reserve_inventory", state)
+
+    assert await saga_store.is_step_complete(saga_id, "reserve_inventory") is True
+    loaded = await saga_store.load(saga_id)
+    assert loaded is not None
+    assert loaded.status == "reserved"
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_is_step_complete(saga_store: MongoSagaStateStore):
@@ -107,6 +107,27 @@ async def test_single_mode_load_nonexistent(
     assert loaded is None
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_single_mode_save_snapshots(single_snapshot_storage: MongoSnapshotStorage):
+    """Test saving several snapshots at once in single mode."""
+    first = BankAccount(owner="Fay", balance=10)
+    first.version = 1
+    second = BankAccount(owner="Gus", balance=20)
+    second.version = 2
+    updated = first.model_copy(update={"balance": 15, "version": 3})
+
+    await single_snapshot_storage.save_snapshots([first, second, updated])
+
+    loaded = await single_snapshot_storage.load_snapshot(first.id)
+    assert loaded is not None
+    assert loaded.balance == 15
+    assert loaded.version == 3
+    loaded = await single_snapshot_storage.load_snapshot(second.id)
+    assert loaded is not None
+    assert loaded.owner == "Gus"
+
+
 # ============ Multiple Mode Tests ============
 
 
@@ -229,3 +229,18 @@ async def test_in_memory_no_snapshot_returns_none():
 
     loaded_with_version = await backend.load_snapshot(non_existent_id, intended_version=10)
     assert loaded_with_version is None
+
+
+@pytest.mark.asyncio
+async def test_save_snapshots_defaults_to_saving_each_in_order():
+    """Test the default save_snapshots saves each aggregate via save_snapshot."""
+    backend = InMemoryAggregateSnapshotStorageBackend()
+    first, second = BankAccount(), BankAccount()
+    first.version = 1
+    later = first.model_copy(update={"version": 2})
+
+    await backend.save_snapshots([first, second, later])
+
+    assert await backend.load_snapshot(first.id) is later
+    assert await backend.load_snapshot(first.id, intended_version=1) is first
+    assert await backend.load_snapshot(second.id) is second
@@ -225,3 +225,77 @@ async def test_create_does_not_apply_non_matching_middleware(
     events = await event_store.load_events(aggregate_id, 1)
     assert len(events) == 1
     assert events[0].data.amount == 7
+
+
+@pytest.mark.asyncio
+async def test_command_bus_skips_middleware_that_does_not_intercept_command(
+    aggregate_id: UUID, base_app_builder
+):
+    from interlock.application.commands import CommandBus
+    from interlock.application.middleware import Middleware
+    from interlock.routing import intercepts
+
+    class OpenOnly(Middleware):
+        @intercepts
+        async def track_open(self, command: OpenAccount, next):
+            return await next(command)
+
+    app = base_app_builder.register_aggregate(BankAccount).register_middleware(OpenOnly).build()
+    bus = app.contextual_binding.container.resolve(CommandBus)
+
+    await app.dispatch(OpenAccount(aggregate_id=aggregate_id, owner="Bob"))
+    await app.dispatch(DepositMoney(aggregate_id=aggregate_id, amount=7))
+
+    assert bus._chains[DepositMoney] == bus.root_handler.handle
+    assert bus._chains[OpenAccount] != bus.root_handler.handle
+
+
+@pytest.mark.asyncio
+async def test_command_bus_passes_next_handler_by_position(aggregate_id: UUID, base_app_builder):
+    from interlock.application.middleware import Middleware
+
+    seen = []
+
+    class Proceeding(Middleware):
+        async def intercept(self, message, proceed):
+            seen.append(type(message))
+            return await proceed(message)
+
+    app = base_app_builder.register_aggregate(BankAccount).register_middleware(Proceeding).build()
+
+    await app.dispatch(OpenAccount(aggregate_id=aggregate_id, owner="Bob"))
+
+    assert seen == [OpenAccount]
+
+
+@pytest.mark.asyncio
+async def test_command_bus_applies_middleware_for_virtual_subclasses(
+    aggregate_id: UUID, base_app_builder
+):
+    from abc import ABC, abstractmethod
+
+    from interlock.application.middleware import Middleware
+    from interlock.routing import intercepts
+
+    class Audited(ABC):
+        @abstractmethod
+        def audit_label(self) -> str: ...
+
+    Audited.register(OpenAccount)
+    seen = []
+
+    class AuditMiddleware(Middleware):
+        @intercepts
+        async def audit(self, command: Audited, next):
+            seen.append(type(command))
+            return await next(command)
+
+    app = (
+        base_app_builder.register_aggregate(BankAccount)
+        .register_middleware(AuditMiddleware)
+        .build()
+    )
+
+    await app.dispatch(OpenAccount(aggregate_id=aggregate_id, owner="Bob"))
+
+    assert seen == [OpenAccount]
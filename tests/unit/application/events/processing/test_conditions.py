@@ -377,3 +377,13 @@ def test_deeply_nested_conditions():
     # Innermost AnyOf (50 events) + middle AfterNAge met
     lag = Lag(unprocessed_events=75, average_event_age=timedelta(minutes=5))
     assert condition.should_catchup(lag)
+
+
+def test_nested_conditions_of_the_same_kind_are_flattened():
+    """Test that AnyOf(AnyOf(a, b), c) evaluates like AnyOf(a, b, c)."""
+    a, b, c = AfterNEvents(100), AfterNAge(timedelta(minutes=5)), Never()
+    all_of = AllOf(b, c)
+
+    assert AnyOf(AnyOf(a, b), c).conditions == (a, b, c)
+    assert AllOf(AllOf(a, b), c).conditions == (a, b, c)
+    assert AnyOf(all_of, a).conditions == (all_of, a)
@@ -1,12 +1,14 @@
 """Tests for EventProcessorExecutor."""
 
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 
-from interlock.application.events import InMemoryEventTransport
+from interlock.application.events import EventSubscription, InMemoryEventTransport
 from interlock.application.events.processing.conditions import (
     AfterNAge,
     AfterNEvents,
@@ -112,6 +114,12 @@ def test_executor_init_validates_batch_size(processor):
         EventProcessorExecutor(processor, Never(), NoCatchup(), batch_size=-10)
 
 
+def test_executor_init_validates_max_batch_delay(processor):
+    """Test executor raises ValueError for non-positive max_batch_delay."""
+    with pytest.raises(ValueError, match="max_batch_delay must be positive"):
+        EventProcessorExecutor(processor, Never(), NoCatchup(), max_batch_delay=timedelta())
+
+
 # Event Batch Processing Tests
 
 
@@ -275,6 +283,119 @@ async def test_process_batch_handles_missing_correlation_id(executor, processor,
     assert processor.total_accounts_opened == 1
 
 
+@pytest.mark.asyncio
+async def test_process_batch_stops_after_max_batch_delay(processor, transport):
+    """Test a partially filled batch is cut short once max_batch_delay elapses."""
+
+    class StallingSubscription(EventSubscription):
+        """Yields the given events, then blocks as if waiting for new ones."""
+
+        def __init__(self, events):
+            self.events = list(events)
+
+        async def depth(self):
+            return len(self.events)
+
+        async def next(self):
+            if not self.events:
+                await asyncio.Event().wait()
+            return self.events.pop(0)
+
+    sub = StallingSubscription([event(MoneyDeposited(amount=Decimal("10.00")))] * 2)
+    executor = EventProcessorExecutor(
+        processor, Never(), NoCatchup(), batch_size=10, max_batch_delay=timedelta(milliseconds=10)
+    )
+
+    await executor.process_event_batch(sub)
+
+    assert processor.deposit_count == 2
+
+
+@pytest.mark.asyncio
+async def test_process_batch_reads_available_events_without_waiting(processor, transport):
+    """Test buffered events are drained with a single depth check."""
+    sub = await publish_and_subscribe(
+        transport, [event(MoneyDeposited(amount=Decimal("10.00"))) for _ in range(3)]
+    )
+    depth_calls = 0
+    original_depth = sub.depth
+
+    async def counting_depth():
+        nonlocal depth_calls
+        depth_calls += 1
+        return await original_depth()
+
+    sub.depth = counting_depth
+    executor = EventProcessorExecutor(
+        processor, Never(), NoCatchup(), batch_size=3, max_batch_delay=timedelta(seconds=1)
+    )
+
+    await executor.process_event_batch(sub)
+
+    assert processor.deposit_count == 3
+    assert depth_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_process_batch_ends_after_max_batch_delay_on_drained_stream(processor, transport):
+    """Test a batch waiting on an empty in-memory stream ends after the delay."""
+    sub = await publish_and_subscribe(transport, [event(MoneyDeposited(amount=Decimal("10.00")))])
+    executor = EventProcessorExecutor(
+        processor, Never(), NoCatchup(), batch_size=10, max_batch_delay=timedelta(milliseconds=20)
+    )
+
+    await asyncio.wait_for(executor.process_event_batch(sub), 1)
+
+    assert processor.deposit_count == 1
+
+
+@pytest.mark.asyncio
+async def test_process_batch_keeps_read_pending_after_max_batch_delay(processor, transport):
+    """Test an event arriving after the delay starts the next batch."""
+    sub = await transport.subscribe("test")
+    next_calls = 0
+    original_next = sub.next
+
+    async def counting_next():
+        nonlocal next_calls
+        next_calls += 1
+        return await original_next()
+
+    sub.next = counting_next
+    executor = EventProcessorExecutor(
+        processor, Never(), NoCatchup(), batch_size=1, max_batch_delay=timedelta(milliseconds=20)
+    )
+
+    await executor.process_event_batch(sub)
+    await transport.publish_events([event(MoneyDeposited(amount=Decimal("10.00")))])
+    await executor.process_event_batch(sub)
+
+    assert processor.deposit_count == 1
+    assert next_calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="requires time.tzset")
+async def test_process_batch_treats_naive_timestamps_as_utc(executor, transport, now, monkeypatch):
+    """Test naive event timestamps are read as UTC rather than local time."""
+    naive = (now - timedelta(minutes=5)).replace(tzinfo=None)
+    sub = await publish_and_subscribe(
+        transport, [event(AccountOpened(owner="Alice"), timestamp=naive)]
+    )
+    executor.batch_size = 1
+
+    # Run off UTC, where reading the timestamp as local time would be wrong.
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        age = await executor.process_event_batch(sub)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert timedelta(minutes=5) <= age < timedelta(minutes=6)
+
+
 # Batch and Catchup Logic Tests
 
 
@@ -373,8 +494,8 @@ async def test_run_executes_initial_catchup(processor, transport):
     executor = EventProcessorExecutor(processor, Never(), strategy, batch_size=1)
     sub = await transport.subscribe("test")
 
-    with pytest.raises(IndexError):  # No events to process
-        await executor.run(sub)
+    with pytest.raises(asyncio.TimeoutError):  # Waits for events to process
+        await asyncio.wait_for(executor.run(sub), 0.05)
 
     assert strategy.catchup_calls == 1
 
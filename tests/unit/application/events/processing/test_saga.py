@@ -162,6 +162,30 @@ async def test_saga_step_idempotency():
     assert len(saga.dispatched_commands) == 1
 
 
+@pytest.mark.asyncio
+async def test_saga_step_completes_step_and_saves_state_together():
+    """Test steps returning state record it with a single complete_step call."""
+    calls = []
+
+    class RecordingStore(InMemorySagaStateStore):
+        async def complete_step(self, saga_id, step_name, state):
+            calls.append((saga_id, step_name))
+            await super().complete_step(saga_id, step_name, state)
+
+        async def save(self, saga_id, state):
+            calls.append(("save", saga_id))
+            await super().save(saga_id, state)
+
+    store = RecordingStore()
+    saga = CheckoutSaga(store)
+
+    await saga.on_checkout_initiated(CheckoutInitiated(saga_id="order-1", customer_id="c"))
+
+    assert calls == [("order-1", "on_checkout_initiated"), ("save", "order-1")]
+    assert await store.is_step_complete("order-1", "on_checkout_initiated") is True
+    assert (await store.load("order-1")).status == "started"
+
+
 @pytest.mark.asyncio
 async def test_saga_step_with_custom_extractor():
     """Test saga step with custom saga_id extractor."""
@@ -0,0 +1,128 @@
+"""Tests for InMemoryEventStore."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from interlock.application.events import InMemoryEventStore
+from interlock.application.events.store import EventStore
+from interlock.domain import Event
+from interlock.domain.exceptions import ConcurrencyError
+from tests.fixtures.test_app.aggregates.bank_account import MoneyDeposited
+
+
+def events(aggregate_id: UUID, start: int, count: int) -> list[Event[MoneyDeposited]]:
+    return [
+        Event(
+            id=uuid4(),
+            aggregate_id=aggregate_id,
+            data=MoneyDeposited(amount=Decimal(n)),
+            sequence_number=n,
+            timestamp=datetime.now(timezone.utc),
+        )
+        for n in range(start, start + count)
+    ]
+
+
+@pytest.fixture
+def store():
+    return InMemoryEventStore()
+
+
+@pytest.mark.asyncio
+async def test_save_events_batch_saves_each_aggregate(store):
+    first, second = uuid4(), uuid4()
+
+    await store.save_events_batch(
+        [(events(first, 1, 2), 0), (events(second, 1, 1), 0), (events(first, 3, 1), 2)]
+    )
+
+    assert [e.sequence_number for e in await store.load_events(first, 0)] == [1, 2, 3]
+    assert [e.sequence_number for e in await store.load_events(second, 0)] == [1]
+
+
+@pytest.mark.asyncio
+async def test_save_events_batch_writes_nothing_on_conflict(store):
+    first, second = uuid4(), uuid4()
+    await store.save_events(events(second, 1, 1), 0)
+
+    with pytest.raises(ConcurrencyError):
+        await store.save_events_batch([(events(first, 1, 1), 0), (events(second, 1, 1), 0)])
+
+    assert await store.load_events(first, 0) == []
+    assert len(await store.load_events(second, 0)) == 1
+
+
+@pytest.mark.asyncio
+async def test_default_batch_and_iter_methods_delegate():
+    saved = []
+
+    class RecordingStore(EventStore):
+        async def save_events(self, events, expected_version):
+            saved.append((len(events), expected_version))
+
+        async def load_events(self, aggregate_id, min_version):
+            return [aggregate_id, min_version]
+
+        async def rewrite_events(self, events):
+            pass
+
+    aggregate_id = uuid4()
+    await RecordingStore().save_events_batch(
+        [(events(aggregate_id, 1, 2), 0), (events(aggregate_id, 3, 1), 2)]
+    )
+
+    assert saved == [(2, 0), (1, 2)]
+    iterated = [event async for event in RecordingStore().load_events_iter(aggregate_id, 3)]
+    assert iterated == [aggregate_id, 3]
+
+
+@pytest.mark.asyncio
+async def test_load_events_returns_events_from_min_version(store):
+    aggregate_id = uuid4()
+    await store.save_events(events(aggregate_id, 1, 5), 0)
+
+    for min_version, expected in [(0, [1, 2, 3, 4, 5]), (1, [1, 2, 3, 4, 5]), (4, [4, 5])]:
+        loaded = await store.load_events(aggregate_id, min_version)
+        assert [e.sequence_number for e in loaded] == expected
+    assert await store.load_events(aggregate_id, 6) == []
+    assert await store.load_events(uuid4(), 0) == []
+
+
+@pytest.mark.asyncio
+async def test_rewrite_events_replaces_matching_events(store):
+    aggregate_id = uuid4()
+    original = events(aggregate_id, 1, 3)
+    await store.save_events(original, 0)
+    rewritten = original[1].model_copy(update={"data": MoneyDeposited(amount=Decimal("42"))})
+
+    await store.rewrite_events([rewritten, *events(uuid4(), 1, 1)])
+
+    loaded = await store.load_events(aggregate_id, 0)
+    assert loaded == [original[0], rewritten, original[2]]
+
+
+@pytest.mark.asyncio
+async def test_reads_and_failed_writes_do_not_create_streams(store):
+    aggregate_id = uuid4()
+
+    await store.load_events(aggregate_id, 0)
+    with pytest.raises(ConcurrencyError):
+        await store.save_events(events(aggregate_id, 2, 1), 1)
+
+    assert aggregate_id not in store.by_aggregate_id
+    assert aggregate_id not in store.sequence_numbers
+
+
+@pytest.mark.asyncio
+async def test_load_events_iter_matches_load_events(store):
+    aggregate_id = uuid4()
+    await store.save_events(events(aggregate_id, 1, 5), 0)
+
+    for min_version in (0, 3, 6):
+        expected = await store.load_events(aggregate_id, min_version)
+        iterated = [event async for event in store.load_events_iter(aggregate_id, min_version)]
+        assert iterated == expected
+    assert [event async for event in store.load_events_iter(uuid4(), 0)] == []
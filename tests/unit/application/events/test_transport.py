@@ -0,0 +1,126 @@
+"""Tests for InMemoryEventTransport subscriptions."""
+
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from interlock.application.events import InMemoryEventTransport
+from interlock.application.events.transport import EventSubscription, EventTransport
+from interlock.domain import Event
+from tests.fixtures.test_app import AccountStatisticsProcessor
+from tests.fixtures.test_app.aggregates.bank_account import (
+    AccountOpened,
+    MoneyDeposited,
+    MoneyWithdrawn,
+)
+
+
+def event(data):
+    return Event(
+        id=uuid4(),
+        aggregate_id=uuid4(),
+        data=data,
+        sequence_number=1,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture
+def transport():
+    return InMemoryEventTransport()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_types_skips_other_events(transport):
+    opened = event(AccountOpened(owner="Alice"))
+    deposited = event(MoneyDeposited(amount=Decimal("10.00")))
+    withdrawn = event(MoneyWithdrawn(amount=Decimal("5.00")))
+    await transport.publish_events([opened, deposited, withdrawn])
+
+    sub = await transport.subscribe_to_types("test", (AccountOpened, MoneyWithdrawn))
+
+    assert await sub.depth() == 2
+    assert await sub.next() is opened
+    assert await sub.next() is withdrawn
+    assert await sub.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_types_depth_tracks_reads_and_publishes(transport):
+    sub = await transport.subscribe_to_types("test", (MoneyDeposited,))
+    await transport.publish_events(
+        [event(MoneyDeposited(amount=Decimal("1"))), event(AccountOpened(owner="Alice"))]
+    )
+
+    assert await sub.depth() == 1
+    await sub.next()
+    assert await sub.depth() == 0
+
+    await transport.publish_events(
+        [event(MoneyDeposited(amount=Decimal("2"))), event(MoneyDeposited(amount=Decimal("3")))]
+    )
+    await sub.next()
+    assert await sub.depth() == 1
+
+
+@pytest.mark.asyncio
+async def test_next_waits_for_published_events(transport):
+    sub = await transport.subscribe_to_types("test", (MoneyDeposited,))
+    read = asyncio.ensure_future(sub.next())
+
+    await transport.publish_events([event(AccountOpened(owner="Alice"))])
+    await asyncio.sleep(0)
+    assert not read.done()
+
+    deposited = event(MoneyDeposited(amount=Decimal("10.00")))
+    await transport.publish_events([deposited])
+
+    assert await asyncio.wait_for(read, 1) is deposited
+
+
+@pytest.mark.asyncio
+async def test_cancelled_next_stops_waiting_for_events(transport):
+    sub = await transport.subscribe("test")
+    read = asyncio.ensure_future(sub.next())
+    await asyncio.sleep(0)
+    assert len(transport._waiters) == 1
+
+    read.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await read
+
+    assert transport._waiters == []
+
+
+@pytest.mark.asyncio
+async def test_subscribe_sees_all_events(transport):
+    await transport.publish_events(
+        [event(AccountOpened(owner="Alice")), event(MoneyDeposited(amount=Decimal("1")))]
+    )
+
+    sub = await transport.subscribe("test")
+
+    assert await sub.depth() == 2
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_types_defaults_to_full_stream():
+    class UnfilteredTransport(EventTransport):
+        async def subscribe(self, identifier: str) -> EventSubscription:
+            return await InMemoryEventTransport().subscribe(identifier)
+
+        async def publish_events(self, events):
+            pass
+
+    sub = await UnfilteredTransport().subscribe_to_types("test", (AccountOpened,))
+
+    assert sub.event_types is None
+
+
+def test_processor_reports_handled_event_types():
+    handled = AccountStatisticsProcessor.handled_event_types()
+
+    assert set(handled) == {AccountOpened, MoneyDeposited, MoneyWithdrawn}
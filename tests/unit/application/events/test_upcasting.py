@@ -1,5 +1,6 @@
 """Unit tests for event upcasting infrastructure."""
 
+import asyncio
 from uuid import uuid4
 
 import pytest
@@ -9,6 +10,7 @@ from interlock.application.events.upcasting import (
     EagerUpcastingStrategy,
     EventUpcaster,
     LazyUpcastingStrategy,
+    UpcasterMap,
     UpcastingPipeline,
 )
 from interlock.application.events.upcasting.pipeline import extract_upcaster_types
@@ -88,6 +90,31 @@ class TestExtractUpcasterTypes:
         assert source == AccountCreatedV1
         assert target == AccountCreatedV2
 
+    def test_extract_types_is_cached_per_class(self):
+        """Should only introspect each upcaster class once."""
+        extract_upcaster_types.cache_clear()
+
+        extract_upcaster_types(AccountCreatedV1ToV2)
+        extract_upcaster_types(AccountCreatedV1ToV2)
+
+        assert extract_upcaster_types.cache_info().hits == 1
+
+    def test_types_are_bound_when_subclass_is_defined(self):
+        """Should store the extracted types on the upcaster class itself."""
+        assert AccountCreatedV2ToV3._source_type is AccountCreatedV2
+        assert AccountCreatedV2ToV3._target_type is AccountCreatedV3
+
+    def test_unbound_subclass_has_no_types(self):
+        """Should leave types unset for upcasters without type arguments."""
+
+        class Unbound(EventUpcaster):
+            async def upcast_payload(self, data):
+                return data
+
+        assert Unbound._source_type is None
+        with pytest.raises(ValueError, match="must inherit from"):
+            UpcasterMap().register_upcaster(Unbound())
+
     def test_extract_types_fails_without_generic_base(self):
         """Should raise ValueError if class doesn't inherit EventUpcaster[T, U]."""
 
@@ -228,6 +255,22 @@ class TestUpcastingPipeline:
 
         assert AccountCreatedV1 in upcaster_map.upcasters
 
+    def test_register_upcaster_prebinds_dispatch(self, upcaster_map):
+        """Should keep bound upcaster methods per source type in registration order."""
+        first, second = ConditionalUpcaster(), AccountCreatedV1ToV2()
+        upcaster_map.register_upcaster(first)
+        upcaster_map.register_upcaster(second)
+
+        assert upcaster_map.dispatch[AccountCreatedV1] == (
+            (first.can_upcast, first.upcast_event),
+            (None, second.upcast_event),
+        )
+
+    def test_default_can_upcast_is_marked_trivial(self):
+        """Only upcasters overriding can_upcast should need it awaited."""
+        assert AccountCreatedV1ToV2._can_upcast_is_trivial
+        assert not ConditionalUpcaster._can_upcast_is_trivial
+
     @pytest.mark.asyncio
     async def test_upcast_single_event(self, upcaster_map):
         """Should upcast a single event."""
@@ -349,6 +392,76 @@ class TestUpcastingPipeline:
         assert len(upcasted) == 2
         assert all(isinstance(e.data, AccountCreatedV2) for e in upcasted)
 
+    @pytest.mark.asyncio
+    async def test_read_upcast_only_schedules_events_with_upcasters(
+        self, upcaster_map, monkeypatch
+    ):
+        """Events without a registered upcaster should pass straight through."""
+        upcaster_map.register_upcaster(AccountCreatedV1ToV2())
+        pipeline = UpcastingPipeline(LazyUpcastingStrategy(), upcaster_map)
+        chained = []
+        upcast_chain = pipeline.upcast_chain
+
+        async def tracking_upcast_chain(event, max_steps=10):
+            chained.append(event)
+            return await upcast_chain(event, max_steps)
+
+        monkeypatch.setattr(pipeline, "upcast_chain", tracking_upcast_chain)
+        current = Event(
+            aggregate_id=uuid4(),
+            data=AccountCreatedV2(first_name="User", last_name="Two"),
+            sequence_number=2,
+        )
+        old = Event(
+            aggregate_id=uuid4(),
+            data=AccountCreatedV1(owner_name="User One"),
+            sequence_number=1,
+        )
+
+        upcasted = await pipeline.read_upcast([current, old])
+
+        assert chained == [old]
+        assert upcasted[0] is current
+        assert isinstance(upcasted[1].data, AccountCreatedV2)
+
+    @pytest.mark.asyncio
+    async def test_read_upcast_bounds_concurrent_chains(self, upcaster_map, monkeypatch):
+        """At most batch_size chains should be in flight, and order is kept."""
+        upcaster_map.register_upcaster(AccountCreatedV1ToV2())
+        pipeline = UpcastingPipeline(LazyUpcastingStrategy(), upcaster_map, batch_size=2)
+        in_flight = 0
+        peak = 0
+        upcast_chain = pipeline.upcast_chain
+
+        async def tracking_upcast_chain(event, max_steps=10):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return await upcast_chain(event, max_steps)
+
+        monkeypatch.setattr(pipeline, "upcast_chain", tracking_upcast_chain)
+        events = [
+            Event(
+                aggregate_id=uuid4(),
+                data=AccountCreatedV1(owner_name=f"User {i}"),
+                sequence_number=i,
+            )
+            for i in range(5)
+        ]
+
+        upcasted = await pipeline.read_upcast(events)
+
+        assert peak == 2
+        assert [e.data.first_name for e in upcasted] == ["User"] * 5
+        assert [e.sequence_number for e in upcasted] == list(range(5))
+
+    def test_rejects_non_positive_batch_size(self, upcaster_map):
+        """A batch size below one would never make progress."""
+        with pytest.raises(ValueError):
+            UpcastingPipeline(LazyUpcastingStrategy(), upcaster_map, batch_size=0)
+
     @pytest.mark.asyncio
     async def test_write_upcast_lazy_strategy(self, upcaster_map):
         """Lazy strategy should NOT upcast on write."""
@@ -417,3 +530,23 @@ class TestUpcastingPipeline:
         # Second should be unchanged
         assert upcasted_no is event_no
         assert isinstance(upcasted_no.data, AccountCreatedV1)
+
+    @pytest.mark.asyncio
+    async def test_upcast_chain_stops_when_no_upcaster_matches(self, upcaster_map):
+        """Should return the event unchanged when every can_upcast declines."""
+        upcaster_map.register_upcaster(ConditionalUpcaster())
+        upcaster_map.register_upcaster(AccountCreatedV2ToV3())
+        pipeline = UpcastingPipeline(LazyUpcastingStrategy(), upcaster_map)
+        event_yes = Event(
+            aggregate_id=uuid4(),
+            data=AccountCreatedV1(owner_name="John Doe"),
+            sequence_number=1,
+        )
+        event_no = Event(
+            aggregate_id=uuid4(),
+            data=AccountCreatedV1(owner_name="Madonna"),
+            sequence_number=2,
+        )
+
+        assert isinstance((await pipeline.upcast_chain(event_yes)).data, AccountCreatedV3)
+        assert await pipeline.upcast_chain(event_no) is event_no
@@ -275,6 +275,31 @@ class TestQueryBus:
             "first-after",
         ]
 
+    @pytest.mark.asyncio
+    async def test_only_intercepting_middleware_is_chained(self):
+        calls: list[str] = []
+
+        class BalanceOnly(Middleware):
+            @intercepts
+            async def track(self, query: GetAccountBalance, next: Handler):
+                calls.append(type(query).__name__)
+                return await next(query)
+
+        projection = AccountProjection()
+        account_id = uuid4()
+        projection.add_account(account_id, "Eve", "eve@test.com", balance=10)
+
+        query_map = QueryToProjectionMap.from_projections([AccountProjection])
+        registry = ProjectionRegistry.from_projections([projection])
+        delegate = DelegateToProjection(query_map, registry)
+
+        bus = QueryBus(delegate, middleware=[BalanceOnly()])
+
+        assert await bus.dispatch(GetAccountBalance(account_id=account_id)) == 10
+        assert await bus.dispatch(CountAccounts()) == 1
+        assert calls == ["GetAccountBalance"]
+        assert bus._chains[CountAccounts] == delegate.handle
+
     @pytest.mark.asyncio
     async def test_email_lookup_query(self):
         projection = AccountProjection()
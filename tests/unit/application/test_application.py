@@ -1,9 +1,14 @@
 import asyncio
+import sys
 import time
+import types
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 
 import pytest
 
 from interlock.application import Application, ApplicationBuilder, HasLifecycle
+from interlock.domain import Event
 
 
 class ComponentA(HasLifecycle):
@@ -24,6 +29,16 @@ class ComponentB(ComponentA):
     pass
 
 
+def event(data):
+    return Event(
+        id=uuid4(),
+        aggregate_id=uuid4(),
+        data=data,
+        sequence_number=1,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
 @pytest.fixture
 def base_application_with_lifecycle_components(base_app_builder: ApplicationBuilder):
     return base_app_builder.register_dependency(ComponentA).register_dependency(ComponentB).build()
@@ -53,3 +68,191 @@ async def test_shuts_down_components_in_reverse_order(
     component_b = base_application_with_lifecycle_components.resolve(ComponentB)
 
     assert component_a.stopped_at > component_b.stopped_at
+
+
+def test_use_uvloop_runs_on_uvloop_without_changing_policy(
+    base_app_builder: ApplicationBuilder, monkeypatch: pytest.MonkeyPatch
+):
+    def fake_uvloop_run(main):
+        main.close()
+        return "ran on uvloop"
+
+    installed = []
+    monkeypatch.setitem(sys.modules, "uvloop", types.SimpleNamespace(run=fake_uvloop_run))
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", installed.append)
+
+    async def main():
+        return "ran on asyncio"
+
+    app = base_app_builder.use_uvloop().build()
+
+    assert app.run(main()) == "ran on uvloop"
+    assert installed == []
+
+
+def test_use_uvloop_warns_when_not_installed(
+    base_app_builder: ApplicationBuilder, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    async def main():
+        return "ran on asyncio"
+
+    with pytest.warns(RuntimeWarning, match="uvloop is not installed"):
+        app = base_app_builder.use_uvloop().build()
+
+    assert app.run(main()) == "ran on asyncio"
+
+
+def test_build_does_not_create_contexts_for_buses(base_app_builder: ApplicationBuilder):
+    app = base_app_builder.build()
+
+    contexts = app.contextual_binding.type_to_child_container
+    assert type(app.command_bus) not in contexts
+    assert type(app.event_bus) not in contexts
+    assert type(app.query_bus) not in contexts
+
+
+@pytest.mark.asyncio
+async def test_run_event_processors_without_processors_returns_immediately(
+    base_app_builder: ApplicationBuilder,
+):
+    from interlock.application.events import EventTransport
+
+    app = base_app_builder.build()
+    transport = app.resolve(EventTransport)
+    subscribed = []
+
+    async def recording_subscribe(identifier, *args):
+        subscribed.append(identifier)
+
+    transport.subscribe = recording_subscribe
+    transport.subscribe_to_types = recording_subscribe
+
+    await asyncio.wait_for(app.run_event_processors(), 0.1)
+
+    assert subscribed == []
+
+
+@pytest.mark.asyncio
+async def test_register_event_processor_configures_max_batch_delay(
+    base_app_builder: ApplicationBuilder,
+):
+    from interlock.application.events import EventProcessorExecutor, EventTransport
+    from tests.fixtures.test_app import AccountStatisticsProcessor
+    from tests.fixtures.test_app.aggregates.bank_account import AccountOpened
+
+    app = base_app_builder.register_event_processor(
+        AccountStatisticsProcessor, max_batch_delay=timedelta(milliseconds=10)
+    ).build()
+    executor = app.contextual_binding.container_for(AccountStatisticsProcessor).resolve(
+        EventProcessorExecutor
+    )
+    assert executor.max_batch_delay == timedelta(milliseconds=10)
+
+    run = asyncio.ensure_future(app.run_event_processors(AccountStatisticsProcessor))
+    await asyncio.sleep(0.02)
+    transport = app.resolve(EventTransport)
+    await transport.publish_events([event(AccountOpened(owner="Alice"))])
+    await asyncio.sleep(0.02)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+    assert executor.processor.total_accounts_opened == 1
+
+
+@pytest.mark.asyncio
+async def test_run_event_processors_subscribes_to_handled_event_types(
+    base_app_builder: ApplicationBuilder,
+):
+    from interlock.application.events import EventTransport, InMemoryEventTransport
+    from tests.fixtures.test_app import AccountStatisticsProcessor
+
+    class RecordingTransport(InMemoryEventTransport):
+        def __init__(self):
+            super().__init__()
+            self.subscribed_types = []
+
+        async def subscribe_to_types(self, identifier, event_types):
+            self.subscribed_types.append((identifier, event_types))
+            return await super().subscribe_to_types(identifier, event_types)
+
+    app = (
+        base_app_builder.register_dependency(EventTransport, RecordingTransport)
+        .register_event_processor(AccountStatisticsProcessor)
+        .build()
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(app.run_event_processors(AccountStatisticsProcessor), 0.05)
+
+    assert app.resolve(EventTransport).subscribed_types == [
+        ("AccountStatisticsProcessor", AccountStatisticsProcessor.handled_event_types())
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="requires asyncio.TaskGroup")
+async def test_run_event_processors_cancels_siblings_when_one_fails(
+    base_app_builder: ApplicationBuilder,
+):
+    from interlock.application.events import EventProcessor, EventTransport
+    from interlock.routing import handles_event
+    from tests.fixtures.test_app import AccountStatisticsProcessor
+    from tests.fixtures.test_app.aggregates.bank_account import AccountOpened
+
+    class FailingProcessor(EventProcessor):
+        @handles_event
+        async def on_account_opened(self, event: AccountOpened) -> None:
+            raise RuntimeError("processor failed")
+
+    app = (
+        base_app_builder.register_event_processor(FailingProcessor)
+        .register_event_processor(AccountStatisticsProcessor)
+        .build()
+    )
+    await app.resolve(EventTransport).publish_events([event(AccountOpened(owner="Alice"))])
+
+    with pytest.raises(RuntimeError, match="processor failed") as exc_info:
+        await asyncio.wait_for(
+            app.run_event_processors(FailingProcessor, AccountStatisticsProcessor), 1
+        )
+
+    assert isinstance(exc_info.value.__cause__, BaseExceptionGroup)  # noqa: F821
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_warm_up_on_startup_builds_singletons_and_command_chains(
+    base_app_builder: ApplicationBuilder,
+):
+    from interlock.application.events.processing import SagaStateStore
+    from tests.fixtures.test_app.aggregates.bank_account import BankAccount, DepositMoney
+
+    app = base_app_builder.register_aggregate(BankAccount).warm_up_on_startup().build()
+    root = app.contextual_binding.container
+    assert SagaStateStore not in root.resolved
+
+    async with app:
+        assert SagaStateStore in root.resolved
+        assert DepositMoney in app.command_bus._chains
+
+
+@pytest.mark.asyncio
+async def test_startup_does_not_warm_up_by_default(base_app_builder: ApplicationBuilder):
+    from tests.fixtures.test_app.aggregates.bank_account import BankAccount
+
+    app = base_app_builder.register_aggregate(BankAccount).build()
+
+    async with app:
+        assert app.command_bus._chains == {}
+
+
+def test_command_and_query_buses_share_resolved_middleware(base_app_builder: ApplicationBuilder):
+    from tests.conftest import ExecutionTracker
+
+    app = base_app_builder.register_middleware(ExecutionTracker).build()
+
+    assert app.command_bus.middleware is app.query_bus.middleware
+    assert [type(m) for m in app.command_bus.middleware] == [ExecutionTracker]
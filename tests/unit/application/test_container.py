@@ -0,0 +1,173 @@
+import inspect
+
+import pytest
+
+from interlock.application.container import (
+    ContextualBinding,
+    DependencyCircularReferenceError,
+    DependencyContainer,
+    DependencyNotFoundError,
+    FactoryDependency,
+)
+
+
+class Config:
+    pass
+
+
+class Service:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class Client:
+    def __init__(self, service: Service, retries: int = 3):
+        self.service = service
+        self.retries = retries
+
+
+def test_resolves_dependencies_from_annotations():
+    container = DependencyContainer()
+    container.register_singleton(Config)
+    container.register_singleton(Service)
+    container.register_factory(Client, Client)
+
+    client = container.resolve(Client)
+
+    assert client.service is container.resolve(Service)
+    assert client.service.config is container.resolve(Config)
+    assert client.retries == 3
+
+
+def test_factories_create_new_instances_and_singletons_are_shared():
+    container = DependencyContainer()
+    container.register_singleton(Config)
+    container.register_factory(Service, Service)
+
+    assert container.resolve(Config) is container.resolve(Config)
+    assert container.resolve(Service) is not container.resolve(Service)
+
+
+def test_child_container_falls_back_to_parent():
+    parent = DependencyContainer()
+    parent.register_singleton(Config)
+    child = parent.child()
+    child.register_singleton(Service)
+
+    assert child.resolve(Service).config is parent.resolve(Config)
+
+
+def test_raises_for_missing_dependency():
+    container = DependencyContainer()
+    container.register_singleton(Service)
+
+    with pytest.raises(DependencyNotFoundError, match="Config"):
+        container.resolve(Service)
+
+
+def test_raises_for_circular_reference():
+    class A:
+        def __init__(self, b: "B"):
+            pass
+
+    class B:
+        def __init__(self, a: A):
+            pass
+
+    A.__init__.__annotations__["b"] = B
+    container = DependencyContainer()
+    container.register_singleton(A)
+    container.register_singleton(B)
+
+    with pytest.raises(DependencyCircularReferenceError) as error:
+        container.resolve(A)
+
+    assert "A" in str(error.value) and "B" in str(error.value)
+
+
+def test_factory_signature_is_only_inspected_once(monkeypatch: pytest.MonkeyPatch):
+    calls = []
+    signature = inspect.signature
+
+    def counting_signature(obj, *args, **kwargs):
+        calls.append(obj)
+        return signature(obj, *args, **kwargs)
+
+    def make_service(config: Config) -> Service:
+        return Service(config)
+
+    container = DependencyContainer()
+    container.register_singleton(Config)
+    container.register_factory(Service, make_service)
+    monkeypatch.setattr(inspect, "signature", counting_signature)
+
+    for _ in range(3):
+        container.resolve(Service)
+
+    assert calls.count(make_service) == 1
+
+
+def test_reregistering_a_singleton_replaces_the_resolved_instance():
+    container = DependencyContainer()
+    container.register_singleton(Config)
+    first = container.resolve(Config)
+
+    container.register_singleton(Config)
+
+    assert container.resolve(Config) is not first
+
+
+def test_resolve_all_builds_each_singleton_once():
+    built = []
+
+    class Counted(Config):
+        def __init__(self):
+            built.append(self)
+
+    container = DependencyContainer()
+    container.register_singleton(Config, Counted)
+    container.register_singleton(Service)
+    binding = ContextualBinding(container)
+
+    resolved = binding.resolve_all()
+
+    assert len(built) == 1
+    assert resolved == [built[0], container.resolve(Service)]
+
+
+def test_resolve_each_resolves_lazily():
+    container = DependencyContainer()
+    container.register_singleton(Config)
+    container.register_singleton(Service)
+    binding = ContextualBinding(container)
+
+    resolved = binding.resolve_each()
+
+    assert container.resolved == {}
+    assert next(resolved) is container.resolve(Config)
+    assert Service not in container.resolved
+
+
+class KeywordOnly:
+    def __init__(self, config: Config, *, service: Service, label: str = "", flag=True):
+        pass
+
+
+class WithNew:
+    def __new__(cls, service: Service):
+        return super().__new__(cls)
+
+    def __init__(self, config: Config):
+        pass
+
+
+@pytest.mark.parametrize("factory", [Config, Service, Client, KeywordOnly, WithNew])
+def test_required_dependencies_match_signature(factory):
+    expected = [
+        (name, parameter.annotation)
+        for name, parameter in inspect.signature(factory).parameters.items()
+        if parameter.annotation is not inspect.Parameter.empty
+        and parameter.default is inspect.Parameter.empty
+    ]
+
+    assert FactoryDependency(factory).required() == expected
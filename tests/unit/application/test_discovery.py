@@ -69,6 +69,106 @@ def test_find_modules_returns_empty_for_missing_subpackage():
     assert len(modules) == 0
 
 
+def test_find_modules_does_not_import_missing_variants(monkeypatch):
+    """Test that variants that are not children of the package are skipped."""
+    from interlock.application import discovery
+
+    attempted = []
+    monkeypatch.setattr(discovery, "_try_import_module", attempted.append)
+    scanner = ModuleScanner("tests.fixtures.test_app")
+
+    assert list(scanner.find_modules("nonexistent")) == []
+    assert attempted == []
+
+
+def test_clear_cache_finds_modules_added_after_scanner_was_created(tmp_path, monkeypatch):
+    """Test that clearing the cache picks up new children of the package."""
+    import importlib
+    import sys
+
+    package = tmp_path / "growing_app"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+    try:
+        scanner = ModuleScanner("growing_app")
+        assert list(scanner.find_modules("service")) == []
+
+        (package / "services.py").write_text("class AuditService:\n    pass\n")
+        importlib.invalidate_caches()
+        scanner.clear_cache()
+
+        assert [m.__name__ for m in scanner.find_modules("service")] == ["growing_app.services"]
+    finally:
+        sys.modules.pop("growing_app.services", None)
+        sys.modules.pop("growing_app", None)
+
+
+def test_try_import_module_remembers_missing_modules(monkeypatch):
+    """Test that a module that failed to import is not imported again."""
+    from interlock.application import discovery
+
+    attempted = []
+
+    def failing_import(name):
+        attempted.append(name)
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    monkeypatch.setattr(discovery, "_import_module", failing_import)
+    missing: set[str] = set()
+
+    assert discovery._try_import_module("tests.fixtures.missing", missing) is None
+    assert discovery._try_import_module("tests.fixtures.missing", missing) is None
+    assert attempted == ["tests.fixtures.missing"]
+
+
+def test_try_import_module_retries_modules_with_failing_imports(monkeypatch):
+    """Test that a module whose own imports fail is not remembered as missing."""
+    from interlock.application import discovery
+
+    attempted = []
+
+    def failing_import(name):
+        attempted.append(name)
+        raise ModuleNotFoundError("No module named 'dependency'", name="dependency")
+
+    monkeypatch.setattr(discovery, "_import_module", failing_import)
+    missing: set[str] = set()
+
+    assert discovery._try_import_module("tests.fixtures.broken", missing) is None
+    assert discovery._try_import_module("tests.fixtures.broken", missing) is None
+    assert attempted == ["tests.fixtures.broken", "tests.fixtures.broken"]
+    assert missing == set()
+
+
+def test_package_listings_are_cached_per_scanner(monkeypatch):
+    """Test that a scanner lists each package directory only once."""
+    import pkgutil
+
+    listed = []
+    iter_modules = pkgutil.iter_modules
+
+    def counting_iter_modules(path, *args, **kwargs):
+        listed.append(tuple(path))
+        return iter_modules(path, *args, **kwargs)
+
+    monkeypatch.setattr(pkgutil, "iter_modules", counting_iter_modules)
+    scanner = ModuleScanner("tests.fixtures.test_app")
+
+    first = [m.__name__ for m in scanner.scan_all_modules()]
+    second = [m.__name__ for m in scanner.scan_all_modules()]
+
+    assert first == second
+    assert len(listed) == len(set(listed))
+
+    listed.clear()
+    scanner.clear_cache()
+    list(scanner.scan_all_modules())
+    assert listed
+
+
 def test_find_subclasses_discovers_aggregates():
     """Test finding Aggregate subclasses."""
     import tests.fixtures.test_app.aggregates.bank_account as module
@@ -134,6 +234,54 @@ def test_find_all_classes_filters_imported_classes():
         assert cls.__module__ == module.__name__
 
 
+def test_find_all_classes_rescans_reloaded_modules(tmp_path, monkeypatch):
+    """Test that a reloaded module is not served its old classes."""
+    import importlib
+    import sys
+
+    module_file = tmp_path / "reloadable_services.py"
+    module_file.write_text("class FirstService:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+    try:
+        module = importlib.import_module("reloadable_services")
+        assert [c.__name__ for c in ClassScanner.find_all_classes(module)] == ["FirstService"]
+
+        module_file.write_text("class SecondService:\n    pass\n")
+        importlib.reload(module)
+
+        assert "SecondService" in [c.__name__ for c in ClassScanner.find_all_classes(module)]
+    finally:
+        sys.modules.pop("reloadable_services", None)
+
+
+def test_clear_cache_forgets_scanned_classes():
+    """Test that clearing the cache walks modules again."""
+    import tests.fixtures.test_app.services.audit_service as module
+    from interlock.application import discovery
+
+    list(ClassScanner.find_all_classes(module))
+    assert module in discovery._module_classes
+
+    ClassScanner.clear_cache()
+
+    assert module not in discovery._module_classes
+
+
+def test_clear_cache_forgets_registration_types():
+    """Test that clearing the cache drops memoized registration types."""
+    from interlock.application import discovery
+    from tests.fixtures.test_app.services.audit_service import AuditService
+
+    ClassScanner.get_registration_type(AuditService)
+    assert AuditService in discovery._registration_types
+
+    ClassScanner.clear_cache()
+
+    assert AuditService not in discovery._registration_types
+
+
 def test_get_registration_type_returns_abc_parent():
     """Test that ABC parent is returned as registration type."""
     from tests.fixtures.test_app.services.audit_service import (
@@ -0,0 +1,54 @@
+"""Tests for Command ID generation."""
+
+import os
+import time
+from uuid import UUID, uuid4
+
+import pytest
+
+from interlock.domain.command import monotonic_uuid
+from tests.fixtures.test_app.aggregates.bank_account import DepositMoney
+
+
+def test_monotonic_uuid_is_version_7():
+    value = monotonic_uuid()
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_monotonic_uuids_sort_in_creation_order():
+    ids = [monotonic_uuid() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_repeat_parent_ids(monkeypatch):
+    # Freeze the clock so parent and child generate within the same millisecond.
+    now = time.time_ns()
+    monkeypatch.setattr(time, "time_ns", lambda: now)
+    monotonic_uuid()
+    read_end, write_end = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        os.close(read_end)
+        os.write(write_end, monotonic_uuid().bytes)
+        os._exit(0)
+
+    os.close(write_end)
+    parent_id = monotonic_uuid()
+    os.waitpid(pid, 0)
+    with os.fdopen(read_end, "rb") as pipe:
+        child_id = UUID(bytes=pipe.read())
+
+    assert child_id != parent_id
+
+
+def test_commands_get_increasing_command_ids():
+    first = DepositMoney(aggregate_id=uuid4(), amount=1)
+    second = DepositMoney(aggregate_id=uuid4(), amount=1)
+
+    assert first.command_id < second.command_id